@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Script to measure what the translation catalogs cost to ship.
+
+Each locale and each top-level namespace is serialized the way the bundler
+inlines it (minified JSON) and measured raw, gzipped and brotli-compressed, in
+parallel across a process pool. The savings of each proposed consolidation
+(every exact duplicate group) and pruning (--prune) are estimated by measuring
+the catalogs with the change applied. Configured budgets fail the run when
+exceeded.
+
+brotli sizes need the optional `brotli` package and are skipped without it.
+
+Usage:
+    python analyze_bundle_size.py [--budget gzip=20000] [--namespace-budget gzip=8000] [--prune KEY ...]
+"""
+
+import argparse
+import copy
+import glob
+import gzip
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from analyze_redundancies import load_json_file, flatten_dict, iter_exact_duplicates
+from report_writers import add_report_arguments, open_reporter
+
+LOCALES_DIR = 'src/i18n/locales'
+
+METRICS = ('raw', 'gzip', 'brotli')
+
+def serialize_catalog(data) -> bytes:
+    """Serialize catalog data as it ships in the bundle."""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def measure(payload: bytes) -> Dict[str, Optional[int]]:
+    """Return the raw, gzip and brotli byte cost of a payload."""
+    return {
+        'raw': len(payload),
+        'gzip': len(gzip.compress(payload, compresslevel=9)),
+        'brotli': len(brotli.compress(payload, quality=11)) if brotli else None,
+    }
+
+def remove_keys(data: dict, key_paths: List[str]) -> dict:
+    """Return a copy of the catalog without the given keys or subtrees."""
+    pruned = copy.deepcopy(data)
+    for key_path in key_paths:
+        keys = key_path.split('.')
+        current = pruned
+        for key in keys[:-1]:
+            current = current.get(key)
+            if not isinstance(current, dict):
+                break
+        else:
+            current.pop(keys[-1], None)
+    return pruned
+
+def _measure_task(task: Tuple[str, str, bytes]) -> Tuple[str, str, Dict[str, Optional[int]]]:
+    label, scope, payload = task
+    return label, scope, measure(payload)
+
+def find_proposals(catalogs: Dict[str, dict], prune: List[str]) -> List[Tuple[str, List[str]]]:
+    """Return (description, keys to remove) for each consolidation and pruning proposal."""
+    proposals = []
+    if 'en' in catalogs:
+        for value, count, keys in iter_exact_duplicates(flatten_dict(catalogs['en'])):
+            # Consolidating keeps one key and removes the rest
+            proposals.append((f"consolidate {count}× '{value}'", keys[1:]))
+    for key_path in prune:
+        proposals.append((f"prune {key_path}", [key_path]))
+    return proposals
+
+def parse_budgets(specs: List[str]) -> Dict[str, int]:
+    """Parse 'metric=bytes' budget specs."""
+    budgets = {}
+    for spec in specs:
+        metric, sep, limit = spec.partition('=')
+        if not sep or metric not in METRICS or not limit.isdigit():
+            print(f"❌ Invalid budget '{spec}', expected one of {'/'.join(METRICS)}=BYTES")
+            sys.exit(2)
+        if metric == 'brotli' and brotli is None:
+            print("❌ A brotli budget needs the 'brotli' package to be installed")
+            sys.exit(2)
+        budgets[metric] = int(limit)
+    return budgets
+
+def _format_sizes(sizes: Dict[str, Optional[int]]) -> str:
+    return '  '.join(f"{metric} {sizes[metric]:>7}" if sizes[metric] is not None else f"{metric}     n/a"
+                     for metric in METRICS)
+
+def main():
+    """Main function to report catalog bundle cost and check budgets."""
+    parser = argparse.ArgumentParser(description="Measure the shipped size of the translation catalogs.")
+    parser.add_argument('file_paths', nargs='*', help="Locale files (default: every file in src/i18n/locales)")
+    parser.add_argument('--budget', action='append', default=[], metavar='METRIC=BYTES',
+                        help="Maximum size of each locale")
+    parser.add_argument('--namespace-budget', action='append', default=[], metavar='METRIC=BYTES',
+                        help="Maximum size of each top-level namespace")
+    parser.add_argument('--prune', action='append', default=[], metavar='KEY',
+                        help="Estimate the savings of removing this key or subtree")
+    parser.add_argument('--workers', type=int, help="Number of worker processes")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    file_paths = args.file_paths or sorted(glob.glob(os.path.join(LOCALES_DIR, '*.json')))
+    locale_budgets = parse_budgets(args.budget)
+    namespace_budgets = parse_budgets(args.namespace_budget)
+    reporter = open_reporter(args.format, args.output)
+    log = print if reporter is None else (lambda *_: None)
+
+    catalogs = {os.path.splitext(os.path.basename(path))[0]: load_json_file(path) for path in file_paths}
+    proposals = find_proposals(catalogs, args.prune)
+
+    tasks = []
+    for locale, data in catalogs.items():
+        tasks.append((locale, '', serialize_catalog(data)))
+        for namespace, value in data.items():
+            tasks.append((locale, namespace, serialize_catalog(value)))
+        for index, (_, keys) in enumerate(proposals):
+            tasks.append((locale, f"#{index}", serialize_catalog(remove_keys(data, keys))))
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(_measure_task, tasks, chunksize=8))
+
+    totals: Dict[str, Dict[str, Optional[int]]] = {}
+    namespaces: Dict[str, List[Tuple[str, Dict[str, Optional[int]]]]] = {}
+    proposal_sizes: Dict[Tuple[str, int], Dict[str, Optional[int]]] = {}
+    for locale, scope, sizes in results:
+        if scope == '':
+            totals[locale] = sizes
+        elif scope.startswith('#'):
+            proposal_sizes[(locale, int(scope[1:]))] = sizes
+        else:
+            namespaces.setdefault(locale, []).append((scope, sizes))
+
+    violations = []
+
+    log("📦 Translation bundle cost (bytes)")
+    for locale, sizes in totals.items():
+        log("\n" + "=" * 60)
+        log(f"🌐 {locale}: {_format_sizes(sizes)}")
+        log("=" * 60)
+        if reporter:
+            reporter.report('locale-size', f"{locale}: {sizes['gzip']} bytes gzipped",
+                            level='note', locale=locale, **sizes)
+        for metric, limit in locale_budgets.items():
+            if sizes[metric] > limit:
+                violations.append((locale, None, metric, sizes[metric], limit))
+
+        for namespace, ns_sizes in sorted(namespaces.get(locale, []), key=lambda item: -item[1]['gzip']):
+            log(f"   {namespace:<12} {_format_sizes(ns_sizes)}")
+            if reporter:
+                reporter.report('namespace-size', f"{locale}.{namespace}: {ns_sizes['gzip']} bytes gzipped",
+                                level='note', locale=locale, namespace=namespace, **ns_sizes)
+            for metric, limit in namespace_budgets.items():
+                if ns_sizes[metric] > limit:
+                    violations.append((locale, namespace, metric, ns_sizes[metric], limit))
+
+    if proposals:
+        log("\n" + "=" * 60)
+        log("💡 ESTIMATED SAVINGS (all locales)")
+        log("=" * 60)
+        estimates = []
+        for index, (description, keys) in enumerate(proposals):
+            savings = {metric: 0 for metric in METRICS}
+            for locale in catalogs:
+                after = proposal_sizes[(locale, index)]
+                for metric in METRICS:
+                    if after[metric] is not None:
+                        savings[metric] += totals[locale][metric] - after[metric]
+            if brotli is None:
+                savings['brotli'] = None
+            estimates.append((description, keys, savings))
+
+        for description, keys, savings in sorted(estimates, key=lambda item: -item[2]['gzip']):
+            log(f"   {_format_sizes(savings)}  {description}")
+            if reporter:
+                reporter.report('savings-estimate', f"{description}: {savings['gzip']} bytes gzipped",
+                                level='note', description=description, keys=keys, **savings)
+
+    if violations:
+        log("\n" + "=" * 60)
+        log("❌ BUDGET EXCEEDED")
+        log("=" * 60)
+        for locale, namespace, metric, size, limit in violations:
+            scope = f"{locale}.{namespace}" if namespace else locale
+            log(f"   {scope}: {metric} {size} > {limit}")
+            if reporter:
+                reporter.report('budget-exceeded', f"{scope}: {metric} {size} > {limit}",
+                                level='error', locale=locale, namespace=namespace,
+                                metric=metric, size=size, limit=limit)
+    elif locale_budgets or namespace_budgets:
+        log("\n✅ All catalogs are within budget")
+
+    if reporter:
+        reporter.close()
+    if violations:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
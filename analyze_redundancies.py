@@ -3,10 +3,12 @@
 Script to analyse en.json for redundant content and potential consolidation opportunities.
 """
 
+import argparse
 import json
 import re
+import sys
 from collections import defaultdict, Counter
-from typing import Dict, List, Tuple, Set
+from typing import Dict, Iterator, List, Tuple, Set
 import difflib
 
 def load_json_file(file_path: str) -> Dict:
@@ -25,8 +27,8 @@ def flatten_dict(d: Dict, parent_key: str = '', sep: str = '.') -> Dict[str, str
             items.append((new_key, str(v)))
     return dict(items)
 
-def find_exact_duplicates(flattened_dict: Dict[str, str]) -> List[Tuple[str, str, List[str]]]:
-    """Find exact duplicate values."""
+def iter_exact_duplicates(flattened_dict: Dict[str, str]) -> Iterator[Tuple[str, int, List[str]]]:
+    """Yield exact duplicate values as (value, count, keys), in catalog order."""
     value_to_keys = defaultdict(list)
     for key, value in flattened_dict.items():
         # Skip shared components and interpolation patterns
@@ -34,21 +36,28 @@ def find_exact_duplicates(flattened_dict: Dict[str, str]) -> List[Tuple[str, str
             continue
         value_to_keys[value].append(key)
     
-    duplicates = []
     for value, keys in value_to_keys.items():
         if len(keys) > 1:
-            duplicates.append((value, len(keys), keys))
-    
-    return sorted(duplicates, key=lambda x: x[1], reverse=True)
+            yield (value, len(keys), keys)
+
+def find_exact_duplicates(flattened_dict: Dict[str, str]) -> List[Tuple[str, int, List[str]]]:
+    """Find exact duplicate values."""
+    return sorted(iter_exact_duplicates(flattened_dict), key=lambda x: x[1], reverse=True)
 
 def analyze_redundancies(file_path: str):
     """Main analysis function."""
+    from resolve_shared_references import load_resolved_catalog
+    
     print("🔍 Analysing en.json for redundancies...\n")
     
     # Load and flatten the JSON
     data = load_json_file(file_path)
     flattened = flatten_dict(data)
     
+    # Duplicate and size analysis run on the resolved view, so duplicates
+    # hidden behind {{shared.*}} references are counted too
+    resolved = load_resolved_catalog(file_path)
+    
     print(f"📊 Total entries: {len(flattened)}")
     
     # Count shared component usage
@@ -59,12 +68,16 @@ def analyze_redundancies(file_path: str):
     
     print(f"🔄 Shared component references: {shared_usage}")
     
+    raw_size = sum(len(value.encode('utf-8')) for value in flattened.values())
+    resolved_size = sum(len(value.encode('utf-8')) for value in resolved.values())
+    print(f"📏 Value bytes: {raw_size} raw, {resolved_size} resolved")
+    
     # 1. Find exact duplicates
     print("\n" + "="*60)
     print("🔴 EXACT DUPLICATES")
     print("="*60)
     
-    duplicates = find_exact_duplicates(flattened)
+    duplicates = find_exact_duplicates(resolved)
     if duplicates:
         for value, count, keys in duplicates[:10]:  # Show top 10
             print(f"\n📝 Value (appears {count} times):")
@@ -89,8 +102,49 @@ def analyze_redundancies(file_path: str):
     print(f"   - {shared_usage} references to shared components")
     print(f"   - Reduced redundancy through interpolation")
 
+def report_redundancies(file_path: str, reporter):
+    """Stream every duplicate group and a summary to a machine-readable reporter."""
+    from resolve_shared_references import load_resolved_catalog
+    
+    resolved = load_resolved_catalog(file_path)
+    
+    duplicate_groups = 0
+    total_duplicates = 0
+    for value, count, keys in iter_exact_duplicates(resolved):
+        duplicate_groups += 1
+        total_duplicates += count
+        reporter.report('exact-duplicate', f"Value appears {count} times: '{value}'",
+                        file=file_path, value=value, count=count, keys=keys)
+    
+    reporter.report('summary', f"{duplicate_groups} duplicate values, {total_duplicates} instances",
+                    file=file_path, level='note', entries=len(resolved),
+                    duplicate_groups=duplicate_groups, total_duplicates=total_duplicates)
+
+def main():
+    """Parse arguments and run the text or machine-readable analysis."""
+    from report_writers import add_report_arguments, open_reporter
+    from resolve_shared_references import CircularReferenceError, report_circular_reference
+    
+    parser = argparse.ArgumentParser(description="Analyse a translation catalog for redundancies.")
+    parser.add_argument('file_path', nargs='?', default="src/i18n/locales/en.json")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+    
+    reporter = open_reporter(args.format, args.output)
+    try:
+        if reporter is None:
+            analyze_redundancies(args.file_path)
+        else:
+            report_redundancies(args.file_path, reporter)
+    except CircularReferenceError as e:
+        report_circular_reference(e, reporter)
+        sys.exit(1)
+    finally:
+        if reporter:
+            reporter.close()
+
 if __name__ == "__main__":
-    analyze_redundancies("src/i18n/locales/en.json")
+    main()
 
 
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Script to backfill missing translations from identical English values.
+
+For each target locale, every key it already translates is indexed by that key's
+English source value. The keys missing from the locale are then hash-joined
+against the index on their English value, and each hit is filled in with the
+existing translation. Every fill is reported with the key it was copied from.
+Locale files are only written when --write is given.
+
+Translations identical to the English value are left out of the index, since
+they are usually untranslated copies rather than real translations.
+
+Usage:
+    python backfill_translations.py [--write] [--format jsonl|sarif] [locale ...]
+"""
+
+import argparse
+import os
+import sys
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from analyze_redundancies import load_json_file, flatten_dict
+from cleanup_en_json import save_json_file
+from report_writers import add_report_arguments, open_reporter
+from resolve_shared_references import CircularReferenceError, load_resolved_catalog, report_circular_reference
+
+LOCALES_DIR = 'src/i18n/locales'
+
+def build_translation_index(english: Dict[str, str], translated: Dict[str, str]) -> Dict[str, Dict[str, List[str]]]:
+    """Index a locale's translations by English source value.
+
+    Returns {english_value: {translation: [source keys]}}.
+    """
+    index: Dict[str, Dict[str, List[str]]] = {}
+    for key, translation in translated.items():
+        english_value = english.get(key)
+        if english_value is None or translation == english_value:
+            continue
+        index.setdefault(english_value, {}).setdefault(translation, []).append(key)
+    return index
+
+def plan_backfill(english: Dict[str, str], translated: Dict[str, str]) -> List[Tuple[str, str, List[str], bool]]:
+    """Join the missing keys against the index.
+
+    Returns (key, translation, source keys, ambiguous) for every fill.
+    """
+    index = build_translation_index(english, translated)
+    fills = []
+    for key, english_value in english.items():
+        if key in translated:
+            continue
+        candidates = index.get(english_value)
+        if not candidates:
+            continue
+        # When the same English text was translated differently, use the most
+        # common translation and flag the fill for review
+        counts = Counter({translation: len(keys) for translation, keys in candidates.items()})
+        translation, _ = counts.most_common(1)[0]
+        fills.append((key, translation, candidates[translation], len(candidates) > 1))
+    return fills
+
+def set_nested_key(data: dict, key_path: str, value: str) -> bool:
+    """Set a nested key, creating parents. Returns False if a parent is not an object."""
+    keys = key_path.split('.')
+    current = data
+    for key in keys[:-1]:
+        current = current.setdefault(key, {})
+        if not isinstance(current, dict):
+            return False
+    current[keys[-1]] = value
+    return True
+
+def main():
+    """Main function to backfill missing translations in each locale."""
+    parser = argparse.ArgumentParser(description="Backfill missing translations from identical English values.")
+    parser.add_argument('locales', nargs='*', default=['es', 'fr'])
+    parser.add_argument('--write', action='store_true', help="Save the fills to the locale files")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    reporter = open_reporter(args.format, args.output)
+    log = print if reporter is None else (lambda *_: None)
+
+    try:
+        english = load_resolved_catalog(os.path.join(LOCALES_DIR, 'en.json'))
+    except CircularReferenceError as e:
+        report_circular_reference(e, reporter)
+        if reporter:
+            reporter.close()
+        sys.exit(1)
+
+    total_fills = 0
+    for locale in args.locales:
+        locale_path = os.path.join(LOCALES_DIR, f"{locale}.json")
+        data = load_json_file(locale_path)
+        translated = flatten_dict(data)
+        fills = plan_backfill(english, translated)
+
+        log("\n" + "=" * 60)
+        log(f"🌐 {locale}: {len(translated)}/{len(english)} keys translated, {len(fills)} can be backfilled")
+        log("=" * 60)
+
+        filled = 0
+        for key, translation, source_keys, ambiguous in fills:
+            if not set_nested_key(data, key, translation):
+                log(f"  ⚠️  {key}: parent is not an object, skipped")
+                continue
+            filled += 1
+            marker = "  ⚠️  " if ambiguous else "  "
+            log(f"{marker}{key} ← '{translation}' (from {', '.join(source_keys)})")
+            if reporter:
+                reporter.report('backfill', f"{key} ← '{translation}'", file=locale_path,
+                                level='warning' if ambiguous else 'note', locale=locale, key=key,
+                                translation=translation, source_keys=source_keys,
+                                english=english[key], ambiguous=ambiguous)
+
+        if filled and args.write:
+            save_json_file(locale_path, data)
+            log(f"💾 Saved {locale_path}")
+        total_fills += filled
+
+    log("\n" + "=" * 60)
+    log("✅ BACKFILL SUMMARY" + ("" if args.write else " (report only, use --write to save)"))
+    log("=" * 60)
+    log(f"🔄 Translations {'filled' if args.write else 'to fill'}: {total_fills}")
+
+    if reporter:
+        reporter.report('summary', f"{total_fills} translations filled", level='note', fills=total_fills)
+        reporter.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Script to check that translations keep the same {{placeholders}} as English.
+
+Placeholder sets are extracted for every key of every locale in one pass and
+interned as small integers, giving a key × locale table with one int column per
+locale. Each column is then compared against the English column in bulk, and
+only the mismatching rows are decoded for the report. {{shared.*}} references
+are expanded first and are not treated as placeholders.
+
+Exits with status 1 when any mismatch is found, so it can run as a hook.
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+from array import array
+from typing import Dict, FrozenSet, List, Tuple
+
+from report_writers import add_report_arguments, open_reporter
+from resolve_shared_references import CircularReferenceError, load_resolved_catalog, report_circular_reference
+
+LOCALES_DIR = 'src/i18n/locales'
+
+# {{name}} or {{name, format}}, as i18next interpolates them
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*([^}\s,]+)[^}]*\}\}')
+
+MISSING = -1
+
+def extract_placeholders(value: str) -> FrozenSet[str]:
+    """Return the interpolation placeholders used in a value."""
+    if '{{' not in value:
+        return frozenset()
+    return frozenset(name for name in PLACEHOLDER_PATTERN.findall(value) if not name.startswith('shared.'))
+
+class PlaceholderTable:
+    """Columnar key × locale table of interned placeholder sets."""
+
+    def __init__(self, keys: List[str]):
+        self.keys = keys
+        self._row = {key: row for row, key in enumerate(keys)}
+        self.sets: List[FrozenSet[str]] = [frozenset()]
+        self._set_ids: Dict[FrozenSet[str], int] = {frozenset(): 0}
+        self.columns: Dict[str, array] = {}
+
+    def add_locale(self, locale: str, catalog: Dict[str, str]):
+        column = array('i', [MISSING]) * len(self.keys)
+        for key, value in catalog.items():
+            row = self._row.get(key)
+            if row is None:
+                continue
+            placeholders = extract_placeholders(value)
+            set_id = self._set_ids.get(placeholders)
+            if set_id is None:
+                set_id = self._set_ids[placeholders] = len(self.sets)
+                self.sets.append(placeholders)
+            column[row] = set_id
+        self.columns[locale] = column
+
+    def mismatched_rows(self, locale: str, reference: str = 'en') -> List[int]:
+        """Return the rows where a locale's placeholder set differs from the reference."""
+        reference_column = self.columns[reference]
+        return [row for row, (expected, actual) in enumerate(zip(reference_column, self.columns[locale]))
+                if actual != expected and actual != MISSING]
+
+def check_placeholders(catalogs: Dict[str, Dict[str, str]]) -> List[Tuple[str, str, FrozenSet[str], FrozenSet[str]]]:
+    """Return (locale, key, missing, extra) for every placeholder mismatch against en."""
+    table = PlaceholderTable(list(catalogs['en']))
+    for locale, catalog in catalogs.items():
+        table.add_locale(locale, catalog)
+
+    mismatches = []
+    for locale in catalogs:
+        if locale == 'en':
+            continue
+        for row in table.mismatched_rows(locale):
+            expected = table.sets[table.columns['en'][row]]
+            actual = table.sets[table.columns[locale][row]]
+            mismatches.append((locale, table.keys[row], expected - actual, actual - expected))
+    return mismatches
+
+def main():
+    """Main function to report placeholder mismatches across locales."""
+    parser = argparse.ArgumentParser(description="Check that translations keep English placeholders.")
+    parser.add_argument('file_paths', nargs='*', help="Locale files (default: every file in src/i18n/locales)")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    reporter = open_reporter(args.format, args.output)
+    log = print if reporter is None else (lambda *_: None)
+
+    file_paths = args.file_paths or sorted(glob.glob(os.path.join(LOCALES_DIR, '*.json')))
+    try:
+        catalogs = {os.path.splitext(os.path.basename(path))[0]: load_resolved_catalog(path) for path in file_paths}
+        if 'en' not in catalogs:
+            catalogs['en'] = load_resolved_catalog(os.path.join(LOCALES_DIR, 'en.json'))
+    except CircularReferenceError as e:
+        report_circular_reference(e, reporter)
+        if reporter:
+            reporter.close()
+        sys.exit(1)
+
+    mismatches = check_placeholders(catalogs)
+    for locale, key, missing, extra in mismatches:
+        details = []
+        if missing:
+            details.append("missing " + ', '.join(f"{{{{{name}}}}}" for name in sorted(missing)))
+        if extra:
+            details.append("unexpected " + ', '.join(f"{{{{{name}}}}}" for name in sorted(extra)))
+        log(f"❌ {locale}: {key}: {'; '.join(details)}")
+        if reporter:
+            reporter.report('placeholder-mismatch', f"{key}: {'; '.join(details)}",
+                            file=os.path.join(LOCALES_DIR, f"{locale}.json"), level='error',
+                            locale=locale, key=key, missing=sorted(missing), extra=sorted(extra))
+
+    if not mismatches:
+        log(f"✅ Placeholders consistent across {len(catalogs)} locales")
+
+    if reporter:
+        reporter.close()
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
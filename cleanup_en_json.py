@@ -6,6 +6,8 @@ Script to clean up en.json by removing old duplicate keys and interpolation patt
 import json
 import copy
 
+from analyze_bundle_size import measure, serialize_catalog
+
 def load_json_file(file_path: str) -> dict:
     """Load and parse the JSON file."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -180,7 +182,8 @@ def main():
     file_path = "src/i18n/locales/en.json"
     data = load_json_file(file_path)
     
-    print(f"📊 Original file size: {len(str(data))} characters")
+    sizes = measure(serialize_catalog(data))
+    print(f"📊 Original size: {sizes['raw']} bytes ({sizes['gzip']} gzipped)")
     
     # Remove old duplicate keys
     print("\n🔴 Removing old duplicate keys...")
@@ -193,7 +196,8 @@ def main():
     # Save the cleaned file
     save_json_file(file_path, data)
     
-    print(f"📊 Cleaned file size: {len(str(data))} characters")
+    sizes = measure(serialize_catalog(data))
+    print(f"📊 Cleaned size: {sizes['raw']} bytes ({sizes['gzip']} gzipped)")
     
     # Run redundancy analysis to see the improvement
     print("\n🔍 Running redundancy analysis...")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Differential harness for the t() key rewriters.
+
+Runs each legacy rewriter (update_file_translations, update_file_cancel_references,
+update_file_multiple_duplicates_v6/_v7) and the trie engine from
+move_translation_prefixes over the same corpora, using the same mapping table,
+and compares the output byte for byte. Throughput of both is recorded side by
+side.
+
+Corpora:
+- synthetic: generated files using only call forms every rewriter supports
+- edge: call forms the rewriters are known to treat differently
+- real: a copy of the .ts/.tsx files under src
+
+Where output is expected to be identical (see EXPECTED_IDENTICAL) a divergence
+fails the run; elsewhere divergences are flagged for review. Legacy rewriters
+write files in place, so every run works on a scratch copy.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+import update_cancel_references_fixed
+import update_multiple_duplicates_v6
+import update_multiple_duplicates_v7
+import update_translation_references
+from move_translation_prefixes import PrefixTrie, update_file_prefixes
+from update_translation_references import find_typescript_files
+
+# (name, legacy rewriter, mapping table it reads)
+LEGACY_REWRITERS: List[Tuple[str, Callable, Dict[str, str]]] = [
+    ('translations', update_translation_references.update_file_translations,
+     update_translation_references.TRANSLATION_MAPPINGS),
+    ('cancel', update_cancel_references_fixed.update_file_cancel_references,
+     update_cancel_references_fixed.CANCEL_MAPPINGS),
+    ('v6', update_multiple_duplicates_v6.update_file_multiple_duplicates_v6,
+     update_multiple_duplicates_v6.MULTIPLE_DUPLICATES_MAPPINGS_V6),
+    ('v7', update_multiple_duplicates_v7.update_file_multiple_duplicates_v7,
+     update_multiple_duplicates_v7.MULTIPLE_DUPLICATES_MAPPINGS_V7),
+]
+
+# update_file_translations is left out: it applies matches front to back, so
+# offsets drift once a replacement changes length, it always writes single
+# quotes, and its ' + ' mappings have no engine equivalent.
+EXPECTED_IDENTICAL = {
+    ('cancel', 'synthetic'),
+    ('v6', 'synthetic'),
+    ('v7', 'synthetic'),
+}
+
+UNMAPPED_KEYS = [
+    'dialectic.session.title',
+    'shared.actions.cancel',
+    'landing.hero.subtitle',
+    'safety.guidelines.title',
+]
+
+def engine_mapping(mapping: Dict[str, str]) -> Dict[str, str]:
+    """Return the rules the trie engine can express (no concatenations)."""
+    return {old_key: new_key for old_key, new_key in mapping.items() if ' + ' not in new_key}
+
+def generate_synthetic_file(rng: random.Random, keys: List[str], lines: int = 60) -> str:
+    """Generate a component whose t() calls every rewriter handles the same way."""
+    out = ["import React from 'react';", "", "export const Generated = () => {", "  return (", "    <div>"]
+    for _ in range(lines):
+        calls = []
+        for _ in range(rng.randint(1, 3)):
+            key = rng.choice(keys if rng.random() < 0.7 else UNMAPPED_KEYS)
+            quote = rng.choice("'\"`")
+            calls.append(f"{{t({quote}{key}{quote})}}")
+        out.append(f"      <span>{' '.join(calls)}</span>")
+    out += ["    </div>", "  );", "};", ""]
+    return '\n'.join(out)
+
+def generate_edge_file(keys: List[str]) -> str:
+    """Generate call forms the legacy rewriters and the engine treat differently."""
+    out = ["export const Edge = () => {"]
+    for key in keys:
+        out.append(f"  const a = t('{key}', {{ count: 2 }});")
+        out.append(f"  const b = t('{key}.child');")
+        out.append(f"  const c = t('{key}') + t(\"{key}\");")
+    out.append("  return key.split('.');")
+    out += ["};", ""]
+    return '\n'.join(out)
+
+def build_corpora(work_dir: str, seed: int, files: int) -> Dict[str, List[str]]:
+    """Write the corpora under work_dir and return their file lists."""
+    rng = random.Random(seed)
+    all_keys = sorted({key for _, _, mapping in LEGACY_REWRITERS for key in mapping})
+    corpora: Dict[str, List[str]] = {'synthetic': [], 'edge': [], 'real': []}
+
+    synthetic_dir = os.path.join(work_dir, 'synthetic')
+    os.makedirs(synthetic_dir)
+    for index in range(files):
+        path = os.path.join(synthetic_dir, f"Generated{index}.tsx")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(generate_synthetic_file(rng, all_keys))
+        corpora['synthetic'].append(path)
+
+    edge_dir = os.path.join(work_dir, 'edge')
+    os.makedirs(edge_dir)
+    path = os.path.join(edge_dir, 'Edge.tsx')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(generate_edge_file(all_keys))
+    corpora['edge'].append(path)
+
+    real_dir = os.path.join(work_dir, 'real')
+    for source in find_typescript_files('src'):
+        target = os.path.join(real_dir, os.path.relpath(source, 'src'))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(source, target)
+        corpora['real'].append(target)
+    return corpora
+
+def _scratch_copies(paths: List[str], scratch_dir: str) -> List[str]:
+    shutil.rmtree(scratch_dir, ignore_errors=True)
+    copies = []
+    for index, path in enumerate(paths):
+        target = os.path.join(scratch_dir, f"{index}_{os.path.basename(path)}")
+        os.makedirs(scratch_dir, exist_ok=True)
+        shutil.copyfile(path, target)
+        copies.append(target)
+    return copies
+
+def _run(rewrite: Callable[[str], object], paths: List[str], scratch_dir: str,
+         repeat: int) -> Tuple[List[bytes], float]:
+    """Run a rewriter over fresh scratch copies. Returns the outputs and best elapsed seconds."""
+    elapsed = float('inf')
+    for _ in range(repeat):
+        copies = _scratch_copies(paths, scratch_dir)
+        # Legacy rewriters print warnings; keep the report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for path in copies:
+                rewrite(path)
+            elapsed = min(elapsed, time.perf_counter() - start)
+
+    outputs = []
+    for path in copies:
+        with open(path, 'rb') as f:
+            outputs.append(f.read())
+    return outputs, elapsed
+
+def _throughput(size: int, elapsed: float) -> str:
+    return f"{size / elapsed / 1e6:7.2f} MB/s" if elapsed > 0 else "      n/a"
+
+def compare(corpora: Dict[str, List[str]], work_dir: str, repeat: int = 3) -> bool:
+    """Compare every legacy rewriter with the engine. Returns False on unexpected divergence."""
+    ok = True
+    print(f"{'rewriter':<13}{'corpus':<11}{'files':>6}{'diverged':>10}   {'legacy':>12}   {'engine':>12}")
+    print("-" * 70)
+    for name, legacy, mapping in LEGACY_REWRITERS:
+        trie = PrefixTrie(engine_mapping(mapping))
+        for corpus, paths in corpora.items():
+            size = sum(os.path.getsize(path) for path in paths)
+            scratch_dir = os.path.join(work_dir, 'scratch')
+            legacy_out, legacy_time = _run(legacy, paths, scratch_dir, repeat)
+            engine_out, engine_time = _run(lambda path: update_file_prefixes(path, trie),
+                                           paths, scratch_dir, repeat)
+
+            diverged = [path for path, a, b in zip(paths, legacy_out, engine_out) if a != b]
+            expected = (name, corpus) in EXPECTED_IDENTICAL
+            if diverged and expected:
+                marker = "❌"
+                ok = False
+            elif diverged:
+                marker = "⚠️ "
+            else:
+                marker = "✅"
+            print(f"{name:<13}{corpus:<11}{len(paths):>6}{len(diverged):>10}   "
+                  f"{_throughput(size, legacy_time)}   {_throughput(size, engine_time)}  {marker}")
+            for path in diverged[:3]:
+                print(f"     diverged: {os.path.relpath(path, work_dir)}")
+    return ok
+
+def main():
+    """Main function to run the differential comparison."""
+    parser = argparse.ArgumentParser(description="Compare the legacy t() rewriters with the trie engine.")
+    parser.add_argument('--files', type=int, default=200, help="Synthetic files to generate (default: 200)")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the synthetic corpus")
+    parser.add_argument('--repeat', type=int, default=3, help="Timing runs per rewriter; the best is kept")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        corpora = build_corpora(work_dir, args.seed, args.files)
+        print(f"🔬 Comparing {len(LEGACY_REWRITERS)} legacy rewriters with the trie engine\n")
+        ok = compare(corpora, work_dir, args.repeat)
+
+    if ok:
+        print("\n✅ No unexpected divergences")
+    else:
+        print("\n❌ Unexpected divergences found")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Script to find duplicated subtrees (whole objects) in a translation catalog.
+
+Every nested object gets a Merkle-style content hash computed bottom-up in one
+pass: a leaf hashes its value, and an object hashes its sorted (key, child hash)
+pairs. Objects with the same hash are identical subtrees. Objects that share
+most of their (key, child hash) pairs are reported as near-identical.
+
+The same hashes make revision diffs cheap: two subtrees with equal hashes are
+equal, so `--against REV` only descends into subtrees that actually changed.
+"""
+
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from analyze_redundancies import load_json_file
+from report_writers import add_report_arguments, open_reporter
+
+HASH_SIZE = 16
+
+class SubtreeHashes:
+    """Content hashes of every node in a catalog, keyed by dotted path."""
+
+    def __init__(self, data: dict):
+        self.hashes: Dict[str, str] = {}
+        self.children: Dict[str, Dict[str, str]] = {}
+        self.leaf_counts: Dict[str, int] = {}
+        self.root = self._hash('', data)
+
+    def _hash(self, path: str, node) -> str:
+        if not isinstance(node, dict):
+            digest = hashlib.blake2b(b'v' + json.dumps(node, ensure_ascii=False).encode('utf-8'),
+                                     digest_size=HASH_SIZE).hexdigest()
+            self.hashes[path] = digest
+            return digest
+
+        child_hashes = {}
+        leaves = 0
+        for key, child in node.items():
+            child_path = f"{path}.{key}" if path else key
+            child_hashes[key] = self._hash(child_path, child)
+            leaves += self.leaf_counts.get(child_path, 1)
+
+        hasher = hashlib.blake2b(b'o', digest_size=HASH_SIZE)
+        for key in sorted(child_hashes):
+            hasher.update(json.dumps(key).encode('utf-8'))
+            hasher.update(child_hashes[key].encode('ascii'))
+        digest = hasher.hexdigest()
+
+        self.hashes[path] = digest
+        self.children[path] = child_hashes
+        self.leaf_counts[path] = leaves
+        return digest
+
+def _parent(path: str) -> str:
+    return path.rpartition('.')[0]
+
+def find_identical_subtrees(tree: SubtreeHashes) -> List[Tuple[int, List[str]]]:
+    """Return (leaf count, paths) for each group of identical objects.
+
+    Groups nested inside a larger identical group are left out.
+    """
+    by_hash: Dict[str, List[str]] = {}
+    for path, children in tree.children.items():
+        # Empty objects are leftovers from earlier cleanups, not duplicates
+        if path and children:
+            by_hash.setdefault(tree.hashes[path], []).append(path)
+
+    duplicated = {path for paths in by_hash.values() if len(paths) > 1 for path in paths}
+    groups = []
+    for paths in by_hash.values():
+        if len(paths) < 2 or all(_parent(path) in duplicated for path in paths):
+            continue
+        groups.append((tree.leaf_counts[paths[0]], paths))
+    return sorted(groups, key=lambda group: (group[0] * len(group[1]), group[0]), reverse=True)
+
+def find_similar_subtrees(tree: SubtreeHashes, threshold: float = 0.6,
+                          min_children: int = 2) -> List[Tuple[float, str, str, List[str]]]:
+    """Return (similarity, path_a, path_b, shared keys) for near-identical objects.
+
+    Similarity is the Jaccard index of the objects' (key, child hash) pairs.
+    Only objects sharing at least one pair are compared, via an inverted index.
+    """
+    pairs_by_path: Dict[str, Set[Tuple[str, str]]] = {
+        path: set(children.items())
+        for path, children in tree.children.items()
+        if path and len(children) >= min_children
+    }
+    index: Dict[Tuple[str, str], List[str]] = {}
+    for path, pairs in pairs_by_path.items():
+        for pair in pairs:
+            index.setdefault(pair, []).append(path)
+
+    shared_counts: Dict[Tuple[str, str], int] = {}
+    for paths in index.values():
+        for i, path_a in enumerate(paths):
+            for path_b in paths[i + 1:]:
+                shared_counts[(path_a, path_b)] = shared_counts.get((path_a, path_b), 0) + 1
+
+    similar = []
+    for (path_a, path_b), shared in shared_counts.items():
+        if tree.hashes[path_a] == tree.hashes[path_b]:
+            continue
+        union = len(pairs_by_path[path_a]) + len(pairs_by_path[path_b]) - shared
+        similarity = shared / union
+        if similarity >= threshold:
+            shared_keys = sorted(key for key, _ in pairs_by_path[path_a] & pairs_by_path[path_b])
+            similar.append((similarity, path_a, path_b, shared_keys))
+    return sorted(similar, reverse=True)
+
+def diff_revisions(old: SubtreeHashes, new: SubtreeHashes, path: str = '') -> Iterator[Tuple[str, str]]:
+    """Yield ('added' | 'removed' | 'changed', path) for keys and subtrees that differ.
+
+    Subtrees whose hashes match are skipped without being visited.
+    """
+    if old.hashes.get(path) == new.hashes.get(path):
+        return
+    old_children = old.children.get(path)
+    new_children = new.children.get(path)
+    if old_children is None or new_children is None:
+        yield 'changed', path
+        return
+
+    for key in old_children.keys() | new_children.keys():
+        child_path = f"{path}.{key}" if path else key
+        if key not in new_children:
+            yield 'removed', child_path
+        elif key not in old_children:
+            yield 'added', child_path
+        else:
+            yield from diff_revisions(old, new, child_path)
+
+def load_revision(file_path: str, revision: str) -> Optional[dict]:
+    """Load a catalog as it was at a git revision."""
+    result = subprocess.run(['git', 'show', f"{revision}:{file_path}"], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout)
+
+def main():
+    """Main function to report duplicated subtrees and revision differences."""
+    parser = argparse.ArgumentParser(description="Find duplicated subtrees in a translation catalog.")
+    parser.add_argument('file_path', nargs='?', default="src/i18n/locales/en.json")
+    parser.add_argument('--threshold', type=float, default=0.6,
+                        help="Minimum similarity for near-identical subtrees (default: 0.6)")
+    parser.add_argument('--against', metavar='REV', help="Also diff the catalog against a git revision")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    reporter = open_reporter(args.format, args.output)
+    log = print if reporter is None else (lambda *_: None)
+
+    tree = SubtreeHashes(load_json_file(args.file_path))
+    log(f"🌳 Hashed {len(tree.children)} objects and {len(tree.hashes) - len(tree.children)} leaves")
+
+    log("\n" + "=" * 60)
+    log("🔴 IDENTICAL SUBTREES")
+    log("=" * 60)
+    identical = find_identical_subtrees(tree)
+    for leaves, paths in identical:
+        log(f"\n📝 {len(paths)} copies of {leaves} entries:")
+        for path in paths:
+            log(f"   {path}.*")
+        if reporter:
+            reporter.report('identical-subtree', f"{len(paths)} identical subtrees of {leaves} entries",
+                            file=args.file_path, paths=paths, leaves=leaves)
+    if not identical:
+        log("✅ No identical subtrees found!")
+
+    log("\n" + "=" * 60)
+    log("🟡 NEAR-IDENTICAL SUBTREES")
+    log("=" * 60)
+    similar = find_similar_subtrees(tree, args.threshold)
+    for similarity, path_a, path_b, shared_keys in similar:
+        log(f"\n📝 {similarity:.0%} similar: {path_a}.* and {path_b}.*")
+        log(f"   Shared: {', '.join(shared_keys)}")
+        if reporter:
+            reporter.report('similar-subtree', f"{path_a} and {path_b} are {similarity:.0%} similar",
+                            file=args.file_path, level='note', paths=[path_a, path_b],
+                            similarity=round(similarity, 3), shared_keys=shared_keys)
+    if not similar:
+        log("✅ No near-identical subtrees found!")
+
+    if args.against:
+        old_data = load_revision(args.file_path, args.against)
+        if old_data is None:
+            print(f"❌ Could not load {args.file_path} at {args.against}", file=sys.stderr)
+            sys.exit(2)
+        log("\n" + "=" * 60)
+        log(f"🔄 CHANGES SINCE {args.against}")
+        log("=" * 60)
+        changes = sorted(diff_revisions(SubtreeHashes(old_data), tree), key=lambda change: change[1])
+        for kind, path in changes:
+            log(f"   {kind:<8} {path}")
+            if reporter:
+                reporter.report(f"key-{kind}", f"{path} {kind} since {args.against}",
+                                file=args.file_path, level='note', key=path)
+        if not changes:
+            log("✅ No changes")
+
+    if reporter:
+        reporter.close()
+
+if __name__ == "__main__":
+    main()
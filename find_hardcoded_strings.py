@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Script to find hard-coded UI strings in components that already exist in en.json.
+
+An Aho-Corasick automaton is built once over every (resolved) catalog value, and
+each .tsx file is streamed through it, so the scan is linear in the size of the
+source no matter how many catalog values there are. A match is only reported
+when it covers a whole string literal in expression position or a whole JSX text
+node, together with a suggested t() replacement. State values (literals used in
+types, case labels or comparisons) and console.* arguments are not UI text.
+"""
+
+import argparse
+import os
+import re
+import sys
+from collections import deque
+from typing import Dict, Iterator, List, Set, Tuple
+
+from report_writers import add_report_arguments, open_reporter
+from resolve_shared_references import CircularReferenceError, load_resolved_catalog, report_circular_reference
+
+# Values shorter than this are too ambiguous to report (e.g. "OK", "of")
+MIN_VALUE_LENGTH = 3
+
+QUOTE_CHARS = '\'"`'
+
+# A string literal in code follows one of these characters or keywords; after
+# anything else (a word, a closing tag, a comment) the quote is part of text
+EXPRESSION_START_CHARS = '([{,=:?+|&!'
+EXPRESSION_START_WORDS = ('return',)
+
+STRING_LITERAL = r"'[^'\n]*'|\"[^\"\n]*\""
+# Literals used in a type, a case label or an equality test are state values,
+# not UI text; every use of such a value in the file is skipped
+STATE_VALUE_PATTERNS = [
+    re.compile(rf"\bcase\s+({STRING_LITERAL})\s*:"),
+    re.compile(rf"[=!]==?\s*({STRING_LITERAL})"),
+    re.compile(rf"({STRING_LITERAL})\s*[=!]=="),
+    re.compile(rf"<\s*({STRING_LITERAL})"),
+    re.compile(rf"(?<!\|)\|\s*({STRING_LITERAL})"),
+    re.compile(rf"({STRING_LITERAL})\s*\|(?!\|)"),
+    re.compile(rf"[\w$]\??\s*:\s*({STRING_LITERAL})\s*[;=>)]"),
+]
+
+class AhoCorasick:
+    """Multi-pattern matcher over a fixed set of strings."""
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Pattern index ending at a node, and the nearest node on the failure
+        # chain that also ends a pattern
+        self._output: List[int] = [-1]
+        self._dict_link: List[int] = [-1]
+
+        for index, pattern in enumerate(patterns):
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(-1)
+                    self._dict_link.append(-1)
+                node = next_node
+            self._output[node] = index
+
+        self._build_links()
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._output[fail] >= 0 else self._dict_link[fail]
+                queue.append(child)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (end_index, pattern_index) for every occurrence in text."""
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            match = node if output[node] >= 0 else dict_link[node]
+            while match >= 0:
+                yield position + 1, output[match]
+                match = dict_link[match]
+
+def build_value_index(catalog: Dict[str, str]) -> Tuple[List[str], Dict[str, List[str]]]:
+    """Group catalog keys by value, keeping values that are worth matching."""
+    value_to_keys: Dict[str, List[str]] = {}
+    for key, value in catalog.items():
+        if len(value) < MIN_VALUE_LENGTH or not any(char.isalpha() for char in value):
+            continue
+        value_to_keys.setdefault(value, []).append(key)
+
+    # Prefer shared components when suggesting a replacement key
+    for keys in value_to_keys.values():
+        keys.sort(key=lambda key: not key.startswith('shared.'))
+    return list(value_to_keys), value_to_keys
+
+def find_state_values(content: str) -> Set[str]:
+    """Return the string values a file uses as types, case labels or comparison operands."""
+    return {literal[1:-1] for pattern in STATE_VALUE_PATTERNS for literal in pattern.findall(content)}
+
+def _in_expression_position(content: str, quote_index: int) -> bool:
+    index = quote_index - 1
+    while index >= 0 and content[index] in ' \t\r\n':
+        index -= 1
+    if index < 0:
+        return False
+    char = content[index]
+    if char in EXPRESSION_START_CHARS:
+        return True
+    if char == '>':
+        return index > 0 and content[index - 1] == '='
+    word_start = index
+    while word_start > 0 and (content[word_start - 1].isalnum() or content[word_start - 1] in '_$'):
+        word_start -= 1
+    return content[word_start:index + 1] in EXPRESSION_START_WORDS
+
+def _in_console_call(content: str, quote_index: int) -> bool:
+    call = content.rfind('console.', 0, quote_index)
+    if call < 0:
+        return False
+    between = content[call:quote_index]
+    return ';' not in between and between.count('(') > between.count(')')
+
+def _literal_kind(content: str, start: int, end: int, state_values: Set[str] = frozenset()):
+    """Return 'string' or 'jsx' if content[start:end] is a whole literal, else None.
+
+    A quoted span only counts as a string literal in expression position, so
+    quotes inside JSX text or comments are ignored, as are console.* arguments
+    and the file's state values (see find_state_values).
+
+    JSX text must run from one tag to the next: text next to a {…} expression is
+    part of a larger message, and replacing it alone would drop the expression.
+    """
+    if start > 0 and end < len(content):
+        before, after = content[start - 1], content[end]
+        if before in QUOTE_CHARS and after == before:
+            if (content[start:end] in state_values or not _in_expression_position(content, start - 1) or
+                    _in_console_call(content, start - 1)):
+                return None
+            return 'string'
+
+    before_index = start - 1
+    while before_index >= 0 and content[before_index] in ' \t\r\n':
+        before_index -= 1
+    after_index = end
+    while after_index < len(content) and content[after_index] in ' \t\r\n':
+        after_index += 1
+    if (before_index >= 0 and content[before_index] == '>' and
+            after_index < len(content) and content[after_index] == '<'):
+        return 'jsx'
+    return None
+
+def scan_source(content: str, matcher: AhoCorasick) -> Iterator[Tuple[int, str, str]]:
+    """Yield (line, kind, value) for every hard-coded catalog value in a source file."""
+    line = 1
+    line_offset = 0
+    covered_until = 0
+    state_values = find_state_values(content)
+    for end, pattern_index in matcher.iter_matches(content):
+        value = matcher.patterns[pattern_index]
+        start = end - len(value)
+        # Patterns sharing an end position arrive longest first, so a shorter
+        # suffix inside an already reported literal is skipped
+        if start < covered_until:
+            continue
+        kind = _literal_kind(content, start, end, state_values)
+        if kind is None:
+            continue
+        covered_until = end
+        line += content.count('\n', line_offset, start)
+        line_offset = start
+        yield line, kind, value
+
+def find_component_files(directory: str) -> List[str]:
+    """Find all TSX component files, skipping tests."""
+    tsx_files = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in ['node_modules', 'dist', 'build', '.git', '__tests__']]
+        for file in files:
+            if file.endswith('.tsx'):
+                tsx_files.append(os.path.join(root, file))
+    return sorted(tsx_files)
+
+def suggest_replacement(kind: str, key: str) -> str:
+    """Return the t() call that should replace a hard-coded string."""
+    call = f"t('{key}')"
+    return f"{{{call}}}" if kind == 'jsx' else call
+
+def main():
+    """Main function to report hard-coded strings that duplicate catalog values."""
+    parser = argparse.ArgumentParser(description="Find hard-coded UI strings that already exist in en.json.")
+    parser.add_argument('directory', nargs='?', default='src/components')
+    parser.add_argument('--catalog', default='src/i18n/locales/en.json')
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    reporter = open_reporter(args.format, args.output)
+    log = print if reporter is None else (lambda *_: None)
+
+    try:
+        patterns, value_to_keys = build_value_index(load_resolved_catalog(args.catalog))
+    except CircularReferenceError as e:
+        report_circular_reference(e, reporter)
+        if reporter:
+            reporter.close()
+        sys.exit(1)
+    matcher = AhoCorasick(patterns)
+    log(f"🔍 Indexed {len(patterns)} catalog values")
+
+    files = find_component_files(args.directory)
+    log(f"📁 Scanning {len(files)} component files...")
+    log("=" * 60)
+
+    total_findings = 0
+    files_with_findings = 0
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        findings = 0
+        for line, kind, value in scan_source(content, matcher):
+            keys = value_to_keys[value]
+            replacement = suggest_replacement(kind, keys[0])
+            if findings == 0:
+                log(f"\n📝 {file_path}")
+            findings += 1
+            log(f"  {line}: '{value}' → {replacement}")
+            if reporter:
+                reporter.report('hardcoded-string', f"'{value}' already exists as {keys[0]}",
+                                file=file_path, line=line, value=value, kind=kind,
+                                keys=keys, replacement=replacement)
+
+        if findings:
+            files_with_findings += 1
+            total_findings += findings
+
+    log("\n" + "=" * 60)
+    log("✅ SCAN SUMMARY")
+    log("=" * 60)
+    log(f"📁 Files with hard-coded strings: {files_with_findings}")
+    log(f"🔤 Hard-coded strings found: {total_findings}")
+
+    if reporter:
+        reporter.report('summary', f"{total_findings} hard-coded strings in {files_with_findings} files",
+                        level='note', files=files_with_findings, findings=total_findings)
+        reporter.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Script to find the most duplicated values across locale catalogs in bounded memory.
+
+Unlike find_exact_duplicates(), which keeps every value in memory and sorts every
+group, this makes two streaming passes over the catalogs:
+
+1. Each value is hashed to a fixed-size digest and counted in a count-min
+   sketch, whose size does not depend on the number of entries.
+2. Entries whose estimated count is at least 2 are candidates. They are sorted
+   by (digest, value) - in memory, or in disk-backed sorted runs when a spill
+   directory is given - and merged, so exact groups come out one at a time.
+   Only the top K groups are kept, in a min-heap.
+
+The sketch can overestimate but never underestimates, so no duplicate is missed.
+Catalogs are resolved one at a time, so memory grows with the largest single
+catalog rather than with the number of locales.
+"""
+
+import argparse
+import glob
+import hashlib
+import heapq
+import json
+import os
+import sys
+import tempfile
+from array import array
+from itertools import groupby
+from typing import Iterator, List, Optional, Tuple
+
+from report_writers import add_report_arguments, open_reporter
+from resolve_shared_references import CircularReferenceError, load_resolved_catalog, report_circular_reference
+
+LOCALES_DIR = 'src/i18n/locales'
+
+DIGEST_SIZE = 8
+
+class CountMinSketch:
+    """Fixed-size approximate counter for digests."""
+
+    def __init__(self, width: int = 1 << 18, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self._rows = [array('I', bytes(4 * width)) for _ in range(depth)]
+
+    def _indexes(self, digest: bytes) -> Iterator[int]:
+        # Derive one index per row from independent slices of a wider hash
+        wide = hashlib.blake2b(digest, digest_size=4 * self.depth).digest()
+        for row in range(self.depth):
+            yield int.from_bytes(wide[4 * row:4 * row + 4], 'little') % self.width
+
+    def add(self, digest: bytes):
+        for row, index in zip(self._rows, self._indexes(digest)):
+            if row[index] < 0xFFFFFFFF:
+                row[index] += 1
+
+    def estimate(self, digest: bytes) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(digest)))
+
+def value_digest(locale: str, value: str) -> bytes:
+    """Hash a value into a fixed-size digest. Values only collide within a locale."""
+    return hashlib.blake2b(f"{locale}\0{value}".encode('utf-8'), digest_size=DIGEST_SIZE).digest()
+
+def iter_catalog_entries(file_paths: List[str]) -> Iterator[Tuple[str, str, str]]:
+    """Yield (locale, key, value) for every entry that duplicate analysis considers."""
+    for file_path in file_paths:
+        locale = os.path.splitext(os.path.basename(file_path))[0]
+        for key, value in load_resolved_catalog(file_path).items():
+            # Same rules as find_exact_duplicates()
+            if key.startswith('shared.') or '{{shared.' in value:
+                continue
+            yield locale, key, value
+
+def _write_run(records: List[Tuple[str, str, str]], spill_dir: str) -> str:
+    """Sort candidate records and write them to a run file, one per line."""
+    records.sort()
+    fd, path = tempfile.mkstemp(suffix='.run', dir=spill_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    return path
+
+def _read_run(path: str) -> Iterator[Tuple[str, str, str]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield tuple(json.loads(line))
+
+def iter_duplicate_groups(file_paths: List[str], sketch: CountMinSketch,
+                          spill_dir: Optional[str] = None,
+                          run_size: int = 100000) -> Iterator[Tuple[str, List[str]]]:
+    """Yield (value, keys) for every exact duplicate group, in digest order."""
+    for locale, key, value in iter_catalog_entries(file_paths):
+        sketch.add(value_digest(locale, value))
+
+    runs = []
+    buffer: List[Tuple[str, str, str]] = []
+    for locale, key, value in iter_catalog_entries(file_paths):
+        digest = value_digest(locale, value)
+        if sketch.estimate(digest) < 2:
+            continue
+        buffer.append((digest.hex(), value, f"{locale}:{key}"))
+        if spill_dir and len(buffer) >= run_size:
+            runs.append(_write_run(buffer, spill_dir))
+            buffer = []
+
+    try:
+        if runs:
+            if buffer:
+                runs.append(_write_run(buffer, spill_dir))
+                buffer = []
+            merged = heapq.merge(*(_read_run(path) for path in runs))
+        else:
+            buffer.sort()
+            merged = iter(buffer)
+
+        # Sorting by (digest, value) keeps digest collisions in separate groups
+        for (_, value), records in groupby(merged, key=lambda record: record[:2]):
+            keys = [key for _, _, key in records]
+            if len(keys) > 1:
+                yield value, keys
+    finally:
+        for path in runs:
+            os.remove(path)
+
+def find_top_duplicates(file_paths: List[str], top_k: int = 10, spill_dir: Optional[str] = None,
+                        sketch_width: int = 1 << 18) -> Tuple[List[Tuple[str, int, List[str]]], int, int]:
+    """Return the top K duplicate groups plus the total group and instance counts."""
+    sketch = CountMinSketch(width=sketch_width)
+    heap: List[Tuple[int, int, str, List[str]]] = []
+    total_groups = 0
+    total_instances = 0
+
+    for value, keys in iter_duplicate_groups(file_paths, sketch, spill_dir):
+        total_groups += 1
+        total_instances += len(keys)
+        # The group number breaks ties so values and keys are never compared
+        entry = (len(keys), -total_groups, value, keys)
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif heap and entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    top = [(value, count, keys) for count, _, value, keys in sorted(heap, reverse=True)]
+    return top, total_groups, total_instances
+
+def main():
+    """Main function to report the top duplicate values across locales."""
+    parser = argparse.ArgumentParser(description="Find the most duplicated catalog values in bounded memory.")
+    parser.add_argument('file_paths', nargs='*', help="Locale files (default: every file in src/i18n/locales)")
+    parser.add_argument('--top-k', type=int, default=10, help="Number of groups to keep (default: 10)")
+    parser.add_argument('--spill-dir', help="Spill candidates to sorted runs in this directory")
+    parser.add_argument('--sketch-width', type=int, default=1 << 18, help="Counters per sketch row")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+    if args.top_k < 1:
+        parser.error("--top-k must be at least 1")
+
+    file_paths = args.file_paths or sorted(glob.glob(os.path.join(LOCALES_DIR, '*.json')))
+    reporter = open_reporter(args.format, args.output)
+    log = print if reporter is None else (lambda *_: None)
+
+    log(f"🔍 Finding top {args.top_k} duplicates across {len(file_paths)} catalogs...")
+    try:
+        top, total_groups, total_instances = find_top_duplicates(
+            file_paths, args.top_k, args.spill_dir, args.sketch_width)
+    except CircularReferenceError as e:
+        report_circular_reference(e, reporter)
+        if reporter:
+            reporter.close()
+        sys.exit(1)
+
+    log("\n" + "=" * 60)
+    log("🔴 TOP DUPLICATES")
+    log("=" * 60)
+    for value, count, keys in top:
+        log(f"\n📝 Value (appears {count} times):")
+        log(f"   '{value}'")
+        log(f"   Keys: {', '.join(keys)}")
+        if reporter:
+            reporter.report('exact-duplicate', f"Value appears {count} times: '{value}'",
+                            value=value, count=count, keys=keys)
+
+    log("\n" + "=" * 60)
+    log(f"🔴 Duplicate values: {total_groups}")
+    log(f"   Total duplicate instances: {total_instances}")
+
+    if reporter:
+        reporter.report('summary', f"{total_groups} duplicate values, {total_instances} instances",
+                        level='note', duplicate_groups=total_groups, total_duplicates=total_instances)
+        reporter.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Small on-disk cache shared by the i18n analysis scripts.
+
+Entries are keyed by a namespace (e.g. "resolved") and the SHA-256 digest of the
+source content, so a cached entry is only ever reused for byte-identical input.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Optional
+
+CACHE_DIR = '.i18n_cache'
+
+def content_digest(content: bytes) -> str:
+    """Return the SHA-256 hex digest of some content."""
+    return hashlib.sha256(content).hexdigest()
+
+def file_digest(file_path: str) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    with open(file_path, 'rb') as f:
+        return content_digest(f.read())
+
+def _cache_path(namespace: str, digest: str) -> str:
+    return os.path.join(CACHE_DIR, namespace, f"{digest}.json")
+
+def load_cached(namespace: str, digest: str) -> Optional[Any]:
+    """Load a cached entry, or return None if it is missing or unreadable."""
+    try:
+        with open(_cache_path(namespace, digest), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached(namespace: str, digest: str, data: Any):
+    """Store an entry in the cache. Failures are ignored - the cache is optional."""
+    path = _cache_path(namespace, digest)
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Script to move whole translation subtrees to a new prefix.
+
+Prefix rules (e.g. 'admin.dashboard.login' → 'admin.login') are compiled into a
+trie keyed by path segment. Every locale JSON file has the matching subtrees
+detached and grafted in one step, and every t() key under src is rewritten by
+walking the trie, so the cost does not depend on how many leaves a subtree has.
+When rules overlap, the longest matching prefix wins.
+
+Usage:
+    python move_translation_prefixes.py [--dry-run] [--format jsonl|sarif] [old.prefix=new.prefix ...]
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from analyze_redundancies import load_json_file
+from cleanup_en_json import save_json_file
+from report_writers import add_report_arguments, open_reporter
+from update_translation_references import find_typescript_files
+
+# Mapping of old key prefixes to new key prefixes, used when no rules are
+# given on the command line
+PREFIX_MAPPINGS: Dict[str, str] = {
+    # 'admin.dashboard.login': 'admin.login',
+}
+
+LOCALES_DIR = 'src/i18n/locales'
+
+# Matches the key of a t() call, with or without an options argument. A
+# leading \b would stop the regex engine from scanning for the literal "t(",
+# so callers check the preceding character with is_t_call() instead.
+T_CALL_PATTERN = re.compile(r"t\((['\"`])([^'\"`]+)\1")
+
+def is_t_call(content: str, match) -> bool:
+    """Return False for matches that are the tail of a longer name, e.g. split('.')."""
+    start = match.start()
+    return start == 0 or not (content[start - 1].isalnum() or content[start - 1] in '_$')
+
+class PrefixTrie:
+    """Trie of dotted key prefixes mapping each rule to its replacement prefix."""
+
+    def __init__(self, mappings: Optional[Dict[str, str]] = None):
+        self._root: Dict = {}
+        self.rules: Dict[str, str] = {}
+        for old_prefix, new_prefix in (mappings or {}).items():
+            self.add(old_prefix, new_prefix)
+
+    def add(self, old_prefix: str, new_prefix: str):
+        """Add a rule moving everything under old_prefix to new_prefix."""
+        node = self._root
+        for segment in old_prefix.split('.'):
+            node = node.setdefault(segment, {})
+        # Segments never contain '.', so it is safe to use as the rule marker
+        node['.'] = (old_prefix, new_prefix)
+        self.rules[old_prefix] = new_prefix
+
+    def match(self, key: str) -> Optional[Tuple[str, str]]:
+        """Return the (old_prefix, new_prefix) rule with the longest match, if any."""
+        node = self._root
+        best = None
+        for segment in key.split('.'):
+            node = node.get(segment)
+            if node is None:
+                break
+            best = node.get('.', best)
+        return best
+
+    def rewrite(self, key: str) -> Optional[str]:
+        """Return the rewritten key, or None when no rule applies."""
+        rule = self.match(key)
+        if rule is None:
+            return None
+        old_prefix, new_prefix = rule
+        return new_prefix + key[len(old_prefix):]
+
+def rewrite_source(content: str, trie: PrefixTrie) -> Tuple[str, List[Tuple[int, str, str]]]:
+    """Rewrite every matching t() key in some source text in a single pass.
+
+    Returns the new content and a (line, old_key, new_key) entry per rewrite.
+    """
+    changes_made = []
+    position = {'offset': 0, 'line': 1}
+
+    def replace(match):
+        quote_char, old_key = match.group(1, 2)
+        new_key = trie.rewrite(old_key)
+        if new_key is None or new_key == old_key or not is_t_call(content, match):
+            return match.group(0)
+        # Matches arrive in order, so line numbers can be counted incrementally
+        position['line'] += content.count('\n', position['offset'], match.start())
+        position['offset'] = match.start()
+        changes_made.append((position['line'], old_key, new_key))
+        return f"t({quote_char}{new_key}{quote_char}"
+
+    return T_CALL_PATTERN.sub(replace, content), changes_made
+
+def update_file_prefixes(file_path: str, trie: PrefixTrie, dry_run: bool = False,
+                         reporter=None) -> Tuple[int, List[str]]:
+    """Update translation key prefixes in a single file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    new_content, rewrites = rewrite_source(content, trie)
+
+    if new_content != content and not dry_run:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+
+    changes_made = []
+    for line, old_key, new_key in rewrites:
+        changes_made.append(f"  {old_key} → {new_key}")
+        if reporter:
+            reporter.report('key-rewrite', f"{old_key} → {new_key}", file=file_path,
+                            line=line, level='note', old_key=old_key, new_key=new_key)
+    return len(changes_made), changes_made
+
+def _detach(data: dict, key_path: str):
+    """Remove and return the value at key_path, pruning parents left empty."""
+    keys = key_path.split('.')
+    parents = []
+    current = data
+    for key in keys[:-1]:
+        if not isinstance(current.get(key), dict):
+            return None
+        parents.append((current, key))
+        current = current[key]
+
+    if keys[-1] not in current:
+        return None
+    value = current.pop(keys[-1])
+
+    for parent, key in reversed(parents):
+        if parent[key]:
+            break
+        del parent[key]
+    return value
+
+def _graft(data: dict, key_path: str, value) -> List[str]:
+    """Insert value at key_path, merging into an existing object. Returns conflicts."""
+    keys = key_path.split('.')
+    current = data
+    for key in keys[:-1]:
+        if not isinstance(current.get(key), dict):
+            if key in current:
+                return [key_path]
+            current[key] = {}
+        current = current[key]
+
+    return _merge(current, keys[-1], value, key_path)
+
+def _merge(parent: dict, key: str, value, key_path: str) -> List[str]:
+    """Set parent[key] to value, merging objects recursively. Returns conflicts."""
+    if key not in parent:
+        parent[key] = value
+        return []
+    existing = parent[key]
+    if not (isinstance(existing, dict) and isinstance(value, dict)):
+        return [key_path]
+
+    conflicts = []
+    for child_key, child_value in value.items():
+        conflicts.extend(_merge(existing, child_key, child_value, f"{key_path}.{child_key}"))
+    return conflicts
+
+def move_catalog_subtrees(data: dict, trie: PrefixTrie) -> Tuple[List[str], List[str]]:
+    """Move every rule's subtree within a catalog in place. Returns (moves, conflicts)."""
+    moves = []
+    conflicts = []
+
+    # Detach the deepest prefixes first so nested rules take their own subtree
+    # with them before an enclosing rule moves the rest
+    ordered = sorted(trie.rules.items(), key=lambda rule: rule[0].count('.'), reverse=True)
+    detached = []
+    for old_prefix, new_prefix in ordered:
+        value = _detach(data, old_prefix)
+        if value is not None:
+            detached.append((old_prefix, new_prefix, value))
+
+    for old_prefix, new_prefix, value in detached:
+        rule_conflicts = _graft(data, new_prefix, value)
+        if rule_conflicts:
+            conflicts.extend(rule_conflicts)
+        else:
+            moves.append(f"  {old_prefix}.* → {new_prefix}.*")
+    return moves, conflicts
+
+def parse_rules(args: List[str]) -> Dict[str, str]:
+    """Parse 'old.prefix=new.prefix' command line rules."""
+    rules = {}
+    for arg in args:
+        old_prefix, sep, new_prefix = arg.partition('=')
+        if not sep or not old_prefix or not new_prefix:
+            print(f"❌ Invalid rule '{arg}', expected old.prefix=new.prefix")
+            sys.exit(2)
+        rules[old_prefix] = new_prefix
+    return rules
+
+def main():
+    """Main function to move translation subtrees in catalogs and call sites."""
+    parser = argparse.ArgumentParser(description="Move translation subtrees to a new key prefix.")
+    parser.add_argument('rules', nargs='*', metavar='old.prefix=new.prefix')
+    parser.add_argument('--dry-run', action='store_true', help="Report changes without writing files")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    rules = parse_rules(args.rules) or PREFIX_MAPPINGS
+    dry_run = args.dry_run
+    reporter = open_reporter(args.format, args.output)
+    # Keep stdout clean for machine-readable output
+    log = print if reporter is None else (lambda *_: None)
+
+    if not rules:
+        log("✅ No prefix rules given - nothing to move!")
+        if reporter:
+            reporter.close()
+        return
+
+    trie = PrefixTrie(rules)
+    log(f"🌳 Compiled {len(trie.rules)} prefix rules")
+
+    log("\n🔄 Moving subtrees in locale files...")
+    log("=" * 60)
+    # Plan every locale before writing anything, so a conflict in one locale
+    # cannot leave the others (or the sources) moved without it
+    planned = []
+    has_conflicts = False
+    for locale_path in sorted(glob.glob(os.path.join(LOCALES_DIR, '*.json'))):
+        data = load_json_file(locale_path)
+        moves, conflicts = move_catalog_subtrees(data, trie)
+        planned.append((locale_path, data, moves))
+        if conflicts:
+            has_conflicts = True
+            log(f"\n⚠️  {locale_path}: conflicting keys")
+            for conflict in conflicts:
+                log(f"  {conflict}")
+                if reporter:
+                    reporter.report('move-conflict', f"Key already exists: {conflict}",
+                                    file=locale_path, level='error', key=conflict)
+
+    if has_conflicts:
+        log("\n❌ Conflicts found - no locale or source files were changed")
+        if reporter:
+            reporter.close()
+        sys.exit(1)
+
+    for locale_path, data, moves in planned:
+        if moves:
+            log(f"\n📝 {locale_path}")
+            for move in moves:
+                log(move)
+                if reporter:
+                    reporter.report('subtree-move', move.strip(), file=locale_path, level='note')
+            if not dry_run:
+                save_json_file(locale_path, data)
+
+    log("\n🔄 Updating translation references...")
+    log("=" * 60)
+    total_changes = 0
+    files_updated = 0
+    for file_path in find_typescript_files('src'):
+        changes_count, changes = update_file_prefixes(file_path, trie, dry_run, reporter)
+        if changes_count > 0:
+            files_updated += 1
+            total_changes += changes_count
+            log(f"\n📝 {file_path}")
+            for change in changes:
+                log(change)
+
+    log("\n" + "=" * 60)
+    log("✅ UPDATE SUMMARY" + (" (dry run)" if dry_run else ""))
+    log("=" * 60)
+    log(f"📁 Files updated: {files_updated}")
+    log(f"🔄 Total changes: {total_changes}")
+
+    if reporter:
+        reporter.report('summary', f"{files_updated} files updated, {total_changes} changes",
+                        level='note', files_updated=files_updated, total_changes=total_changes)
+        reporter.close()
+
+if __name__ == "__main__":
+    main()
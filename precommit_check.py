@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Fast pre-commit check for staged translation changes.
+
+Only the staged locale files and staged source files are examined, read straight
+from the git index, and every parsed catalog and file scan is cached by git blob
+id, so unchanged inputs are never parsed twice. Only problems the staged
+changes introduce are reported; existing ones in HEAD are left alone. The check
+fails on:
+
+- new exact duplicates in a staged locale file (compared with HEAD);
+- t() keys in staged sources that match nothing in the staged en.json;
+- locale keys that en.json does not have (every locale when en.json is staged);
+- staged locale files that are not valid JSON.
+
+The time used is printed against a latency budget (200 ms by default).
+
+Usage, e.g. from .git/hooks/pre-commit:
+    python precommit_check.py [--budget-ms 200]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from analyze_redundancies import flatten_dict
+from i18n_cache import load_cached, save_cached
+from report_writers import add_report_arguments, open_reporter
+from resolve_dynamic_keys import (KeyTrie, format_pattern, is_unbounded, iter_resolved_usages,
+                                  scan_content)
+
+LOCALES_DIR = 'src/i18n/locales'
+EN_PATH = f"{LOCALES_DIR}/en.json"
+
+CATALOG_NAMESPACE = 'staged-catalog'
+SCAN_NAMESPACE = 'staged-scan-v3'
+
+def _git(*args: str) -> str:
+    result = subprocess.run(['git', *args], capture_output=True, text=True)
+    return result.stdout if result.returncode == 0 else ''
+
+def staged_blobs() -> Dict[str, str]:
+    """Return {path: blob id} for files added, copied, modified or renamed in the index."""
+    blobs = {}
+    for line in _git('diff', '--cached', '--raw', '--no-abbrev', '--no-renames', '--diff-filter=ACM').splitlines():
+        meta, _, path = line.partition('\t')
+        blobs[path] = meta.split()[3]
+    return blobs
+
+def index_blobs(paths: List[str]) -> Dict[str, str]:
+    """Return {path: blob id} for index entries under the given paths."""
+    blobs = {}
+    for line in _git('ls-files', '-s', '--', *paths).splitlines():
+        meta, _, path = line.partition('\t')
+        blobs[path] = meta.split()[1]
+    return blobs
+
+def head_blobs(paths: List[str]) -> Dict[str, str]:
+    """Return {path: blob id} for paths that exist in HEAD."""
+    if not paths:
+        return {}
+    blobs = {}
+    for line in _git('ls-tree', 'HEAD', '--', *paths).splitlines():
+        meta, _, path = line.partition('\t')
+        blobs[path] = meta.split()[2]
+    return blobs
+
+def read_blobs(blob_ids: List[str]) -> Dict[str, bytes]:
+    """Read several blobs with a single git process."""
+    if not blob_ids:
+        return {}
+    result = subprocess.run(['git', 'cat-file', '--batch'], input=''.join(f"{blob}\n" for blob in blob_ids).encode(),
+                            capture_output=True)
+    contents = {}
+    output = result.stdout
+    offset = 0
+    for blob in blob_ids:
+        header_end = output.index(b'\n', offset)
+        header = output[offset:header_end].split()
+        if len(header) < 3:
+            offset = header_end + 1
+            continue
+        size = int(header[2])
+        contents[blob] = output[header_end + 1:header_end + 1 + size]
+        offset = header_end + 1 + size + 1
+    return contents
+
+class BlobCache:
+    """Parsed catalogs and source scans keyed by git blob id."""
+
+    def catalogs(self, blobs: List[str]) -> Dict[str, dict]:
+        """Return {blob: {'data', 'flattened'}} for catalog blobs, or {'error'} if unparsable."""
+        return self._load(CATALOG_NAMESPACE, blobs, self._parse_catalog)
+
+    def scans(self, blobs: List[str]) -> Dict[str, dict]:
+        """Return {blob: scan} for source blobs."""
+        return self._load(SCAN_NAMESPACE, blobs, scan_content)
+
+    def _load(self, namespace: str, blobs: List[str], parse) -> Dict[str, dict]:
+        loaded = {}
+        missing = []
+        for blob in blobs:
+            cached = load_cached(namespace, blob)
+            if cached is None:
+                missing.append(blob)
+            else:
+                loaded[blob] = cached
+        for blob, content in read_blobs(missing).items():
+            loaded[blob] = parse(content.decode('utf-8', errors='replace'))
+            save_cached(namespace, blob, loaded[blob])
+        return loaded
+
+    @staticmethod
+    def _parse_catalog(content: str) -> dict:
+        try:
+            data = json.loads(content)
+        except ValueError as e:
+            return {'error': str(e)}
+        if not isinstance(data, dict):
+            return {'error': "top level is not an object"}
+        return {'data': data, 'flattened': flatten_dict(data)}
+
+def duplicate_groups(flattened: Dict[str, str]) -> Dict[str, Set[str]]:
+    """Return {value: keys} for literal values held by more than one key.
+
+    Unlike iter_exact_duplicates, shared.* keys are included, so a new key that
+    copies a shared value is caught; {{shared.*}} references are not duplicates.
+    """
+    value_to_keys: Dict[str, Set[str]] = {}
+    for key, value in flattened.items():
+        if '{{shared.' not in value:
+            value_to_keys.setdefault(value, set()).add(key)
+    return {value: keys for value, keys in value_to_keys.items() if len(keys) > 1}
+
+def new_duplicates(flattened: Dict[str, str], before: Dict[str, str]) -> List[Tuple[str, List[str], List[str]]]:
+    """Return (value, new keys, existing keys) for duplicates the new version introduces.
+
+    A key counts as new when it was absent before or held a different value.
+    """
+    found = []
+    for value, keys in sorted(duplicate_groups(flattened).items()):
+        added = sorted(key for key in keys if before.get(key) != value)
+        if added:
+            found.append((value, added, sorted(key for key in keys if before.get(key) == value)))
+    return found
+
+def is_source_file(path: str) -> bool:
+    """Return True for .ts/.tsx sources the key scan covers."""
+    return (path.startswith('src/') and path.endswith(('.ts', '.tsx')) and
+            '/__tests__/' not in path and not path.endswith('.d.ts'))
+
+def unknown_usages(scan: dict, trie: KeyTrie) -> List[Tuple[int, List[str]]]:
+    """Return (line, patterns) for t() calls in a scan that match no catalog key.
+
+    Aliases declared in other files are unresolved here and become wildcards,
+    so they can only hide a problem, never invent one.
+    """
+    return [(line, patterns) for _, line, _, patterns in iter_resolved_usages({'': scan})
+            if not all(is_unbounded(pattern) for pattern in patterns)
+            and not any(trie.match(pattern) for pattern in patterns)]
+
+def run_checks(cache: BlobCache) -> List[Tuple[str, str, Optional[int], str]]:
+    """Return (rule, file, line, message) for every problem the staged changes introduce.
+
+    Problems that already exist in HEAD are not reported.
+    """
+    problems = []
+    staged = staged_blobs()
+    locale_paths = [path for path in staged
+                    if os.path.dirname(path) == LOCALES_DIR and path.endswith('.json')]
+    source_paths = [path for path in staged if is_source_file(path)]
+    if not locale_paths and not source_paths:
+        return problems
+
+    # Removing keys from en.json can orphan keys in any locale
+    if EN_PATH in staged:
+        locale_paths = [path for path in index_blobs([LOCALES_DIR])
+                        if os.path.dirname(path) == LOCALES_DIR and path.endswith('.json')]
+    current = index_blobs(sorted({EN_PATH, *locale_paths}))
+    previous = head_blobs(sorted({EN_PATH, *locale_paths, *source_paths}))
+    catalogs = cache.catalogs(sorted({*current.values(),
+                                      *(blob for path, blob in previous.items() if path.endswith('.json'))}))
+    valid = {blob: catalog for blob, catalog in catalogs.items() if 'error' not in catalog}
+    english = valid.get(current.get(EN_PATH))
+    english_before = valid.get(previous.get(EN_PATH))
+
+    for path in locale_paths:
+        if current[path] not in valid:
+            problems.append(('invalid-json', path, None, f"Invalid JSON: {catalogs[current[path]]['error']}"))
+            continue
+        catalog = valid[current[path]]['flattened']
+        before = valid[previous[path]]['flattened'] if previous.get(path) in valid else {}
+        if path in staged:
+            for value, added, existing in new_duplicates(catalog, before):
+                shared = [key for key in existing if key.startswith('shared.')]
+                hint = f" (use {{{{{shared[0]}}}}})" if shared else (f" (same as {', '.join(existing)})" if existing else '')
+                problems.append(('new-duplicate', path, None,
+                                 f"'{value}' duplicated by {', '.join(added)}{hint}"))
+
+        if english and path != EN_PATH:
+            missing = set(catalog) - set(english['flattened'])
+            if english_before:
+                missing -= set(before) - set(english_before['flattened'])
+            for key in sorted(missing):
+                problems.append(('missing-from-en', path, None, f"{key} is not in en.json"))
+
+    if source_paths and english:
+        trie = KeyTrie(english['data'])
+        trie_before = trie if EN_PATH not in staged or not english_before else KeyTrie(english_before['data'])
+        scans = cache.scans(sorted({*(staged[path] for path in source_paths),
+                                    *(previous[path] for path in source_paths if path in previous)}))
+        for path in source_paths:
+            known_broken = set()
+            if path in previous:
+                known_broken = {tuple(patterns) for _, patterns in unknown_usages(scans[previous[path]], trie_before)}
+            for line, patterns in unknown_usages(scans[staged[path]], trie):
+                if tuple(patterns) not in known_broken:
+                    shown = ', '.join(format_pattern(pattern) for pattern in patterns)
+                    problems.append(('unknown-key', path, line, f"t() key not in en.json: {shown}"))
+    return problems
+
+def main():
+    """Main function to check the staged translation changes."""
+    parser = argparse.ArgumentParser(description="Check staged locale and source files for i18n problems.")
+    parser.add_argument('--budget-ms', type=float, default=200, help="Latency budget in ms (default: 200)")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    reporter = open_reporter(args.format, args.output)
+    problems = run_checks(BlobCache())
+
+    for rule, path, line, message in problems:
+        location = f"{path}:{line}" if line else path
+        if reporter:
+            reporter.report(rule, message, file=path, line=line, level='error')
+        else:
+            print(f"❌ {location}: {message}")
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    used = elapsed_ms / args.budget_ms
+    marker = "⏱️ " if used <= 1 else "⚠️  over budget:"
+    summary = f"{marker} {elapsed_ms:.0f} ms of {args.budget_ms:.0f} ms budget ({used:.0%})"
+    if reporter:
+        reporter.report('summary', f"{len(problems)} problems; {summary}", level='note',
+                        problems=len(problems), elapsed_ms=round(elapsed_ms, 1), budget_ms=args.budget_ms)
+        reporter.close()
+        print(summary, file=sys.stderr)
+    else:
+        if not problems:
+            print("✅ No i18n problems in staged files")
+        print(summary)
+
+    if problems:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
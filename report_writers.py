@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Streaming machine-readable reporters for the i18n scripts.
+
+Each finding is written (and flushed) as soon as it is reported, so reports of
+any size can be consumed without buffering them in memory:
+
+- JSON Lines: one JSON object per line.
+- SARIF 2.1.0: a single log whose results array is written incrementally.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Optional, TextIO
+
+REPORT_FORMATS = ('text', 'jsonl', 'sarif')
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+TOOL_NAME = 'swift-to-hear-i18n'
+
+class JsonLinesReporter:
+    """Write each finding as one JSON object per line."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.count = 0
+
+    def report(self, rule_id: str, message: str, file: Optional[str] = None,
+               line: Optional[int] = None, level: str = 'warning', **data: Any):
+        record: Dict[str, Any] = {'rule': rule_id, 'level': level, 'message': message}
+        if file is not None:
+            record['file'] = file
+        if line is not None:
+            record['line'] = line
+        record.update(data)
+        self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.stream.flush()
+        self.count += 1
+
+    def close(self):
+        _close_stream(self.stream)
+
+class SarifReporter:
+    """Write findings as a SARIF log, streaming the results array."""
+
+    def __init__(self, stream: TextIO, tool_name: str = TOOL_NAME):
+        self.stream = stream
+        self.count = 0
+        header = {
+            '$schema': SARIF_SCHEMA,
+            'version': '2.1.0',
+            'runs': [{'tool': {'driver': {'name': tool_name}}, 'results': []}],
+        }
+        # Split the serialized log around the empty results array so results
+        # can be written between the two halves as they arrive
+        text = json.dumps(header)
+        split_at = text.rindex('[]') + 1
+        self.stream.write(text[:split_at])
+        self._footer = text[split_at:]
+
+    def report(self, rule_id: str, message: str, file: Optional[str] = None,
+               line: Optional[int] = None, level: str = 'warning', **data: Any):
+        result: Dict[str, Any] = {
+            'ruleId': rule_id,
+            'level': level,
+            'message': {'text': message},
+        }
+        if file is not None:
+            location: Dict[str, Any] = {'artifactLocation': {'uri': file}}
+            if line is not None:
+                location['region'] = {'startLine': line}
+            result['locations'] = [{'physicalLocation': location}]
+        if data:
+            result['properties'] = data
+
+        if self.count:
+            self.stream.write(',')
+        self.stream.write('\n' + json.dumps(result, ensure_ascii=False))
+        self.stream.flush()
+        self.count += 1
+
+    def close(self):
+        self.stream.write('\n' + self._footer + '\n')
+        _close_stream(self.stream)
+
+def _close_stream(stream: TextIO):
+    if stream is sys.stdout:
+        stream.flush()
+    else:
+        stream.close()
+
+def add_report_arguments(parser: argparse.ArgumentParser):
+    """Add the --format and --output options shared by the reporting scripts."""
+    parser.add_argument('--format', choices=REPORT_FORMATS, default='text',
+                        help="Output format (default: text)")
+    parser.add_argument('--output', help="Write the report to this file instead of stdout")
+
+def open_reporter(report_format: str, output: Optional[str] = None):
+    """Return a streaming reporter for a machine-readable format, or None for text."""
+    if report_format == 'text':
+        return None
+    stream = open(output, 'w', encoding='utf-8') if output else sys.stdout
+    if report_format == 'jsonl':
+        return JsonLinesReporter(stream)
+    return SarifReporter(stream)
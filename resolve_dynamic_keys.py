@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+"""
+Script to statically resolve the translation keys used in src, including dynamic ones.
+
+Besides plain t('a.b') calls, components build keys from template literals
+(t(`dialectic.roles.${role}.title`)) and concatenations (t('a.' + x)). Each key
+expression is turned into a key pattern:
+
+- `cond ? 'a' : 'b'` chains contribute their results when every branch
+  resolves on its own;
+- identifiers declared as a template literal or concatenation are replaced by
+  its parts, which are expanded in turn;
+- identifiers declared as a string constant, or annotated with a string-literal
+  union (directly or through a type alias), contribute those values - unless the
+  name is also bound somewhere the scanner cannot classify (an untyped
+  parameter, a for-of variable, a non-literal initializer), since names are
+  matched without scoping;
+- anything else becomes a wildcard, which may span several key segments.
+
+Patterns are matched against the catalog walked as a prefix trie, so every key a
+component may request is marked as used. A pattern that stops at an object keeps
+the whole subtree. Keys that nothing matches - and that no {{shared.*}} value
+references - are the candidates for safe pruning. If any call is unbounded (it
+could request any key), no candidates are listed and the run fails.
+
+Per-file scan results are cached by content hash.
+"""
+
+import argparse
+import itertools
+import os
+import re
+import sys
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
+
+from analyze_redundancies import load_json_file, flatten_dict
+from i18n_cache import content_digest, load_cached, save_cached
+from move_translation_prefixes import is_t_call
+from report_writers import add_report_arguments, open_reporter
+from resolve_shared_references import SHARED_REFERENCE_PATTERN
+
+# Bump the version when the scan format or its rules change
+CACHE_NAMESPACE = 'key-usage-v3'
+
+# Stands in for an unknown part of a key; matches any text, dots included
+WILDCARD = '\0'
+
+# Larger products of finite value sets are treated as wildcards
+MAX_EXPANSIONS = 256
+
+T_CALL_START = re.compile(r"t\(")
+STRING_LITERAL = r"'[^'\n]*'|\"[^\"\n]*\""
+STRING_UNION = re.compile(rf"^\s*(?:{STRING_LITERAL})(?:\s*\|\s*(?:{STRING_LITERAL}))*\s*$")
+TYPE_ALIAS = re.compile(r"\btype\s+(\w+)\s*=\s*([^;\n]+)")
+ANNOTATION = re.compile(r"\b(\w+)\??\s*:\s*([^;,)=\n{}]+)")
+# Simple declarations and for-of/for-in variables; the initializer, if any, is
+# read up to the end of the line
+DECLARATION = re.compile(r"\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*(:[^=;\n]*)?(?:=(?![=>])\s*([^;\n]*))?")
+DESTRUCTURING = re.compile(r"\b(?:const|let|var)\s*([{\[][^=;]*?[}\]])\s*(?:=|\b(?:of|in)\b)")
+REASSIGNMENT = re.compile(r"^\s*([A-Za-z_$][\w$]*)\s*=(?![=>])\s*(?!['\"{])", re.MULTILINE)
+UNTYPED_PARAM = re.compile(r"\(?\s*(\w+)\s*\)?\s*=>")
+ARROW_PARAMS = re.compile(r"\(([^()]*)\)\s*(?::\s*[^=;{()]+)?=>")
+FUNCTION_PARAMS = re.compile(r"\bfunction\b\s*\*?\s*[\w$]*\s*(?:<[^>]*>)?\s*\(([^()]*)\)")
+IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+IDENTIFIER_PATH = re.compile(r"^[A-Za-z_$][\w$]*(?:\??\.[A-Za-z_$][\w$]*)*$")
+
+# A key expression: literal text interleaved with ('expr', source) parts
+KeyParts = List[Union[str, Tuple[str, str]]]
+
+def _literals(text: str) -> List[str]:
+    return [literal[1:-1] for literal in re.findall(STRING_LITERAL, text)]
+
+def _skip_string(src: str, i: int) -> int:
+    """Return the index just past the string or template literal starting at i."""
+    quote = src[i]
+    i += 1
+    while i < len(src):
+        char = src[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == quote:
+            return i + 1
+        if quote == '`' and src.startswith('${', i):
+            i = _skip_balanced(src, i + 2, '}')
+            continue
+        i += 1
+    return i
+
+def _skip_balanced(src: str, i: int, closer: str) -> int:
+    """Return the index just past the closer that balances an opening bracket."""
+    depth = 0
+    while i < len(src):
+        char = src[i]
+        if char in '\'"`':
+            i = _skip_string(src, i)
+            continue
+        if char in '([{':
+            depth += 1
+        elif char in ')]}':
+            if depth == 0:
+                return i + 1 if char == closer else i
+            depth -= 1
+        i += 1
+    return i
+
+def _read_template(src: str, i: int) -> Tuple[KeyParts, int]:
+    parts: KeyParts = []
+    literal = []
+    i += 1
+    while i < len(src):
+        char = src[i]
+        if char == '\\':
+            literal.append(src[i + 1:i + 2])
+            i += 2
+        elif char == '`':
+            break
+        elif src.startswith('${', i):
+            end = _skip_balanced(src, i + 2, '}')
+            if literal:
+                parts.append(''.join(literal))
+                literal = []
+            parts.append(('expr', src[i + 2:end - 1].strip()))
+            i = end
+        else:
+            literal.append(char)
+            i += 1
+    if literal:
+        parts.append(''.join(literal))
+    return parts, i + 1
+
+def _read_operand(src: str, i: int) -> Tuple[KeyParts, int]:
+    """Read one operand of a key expression, up to a top-level '+', ',' or ')'."""
+    if src[i] == '`':
+        return _read_template(src, i)
+    if src[i] in '\'"':
+        end = _skip_string(src, i)
+        return [src[i + 1:end - 1]], end
+
+    start = i
+    depth = 0
+    while i < len(src):
+        char = src[i]
+        if char in '\'"`':
+            i = _skip_string(src, i)
+            continue
+        if char in '([{':
+            depth += 1
+        elif char in ')]}':
+            if depth == 0:
+                break
+            depth -= 1
+        elif depth == 0 and char in '+,':
+            break
+        i += 1
+    return [('expr', src[start:i].strip())], i
+
+def parse_key_argument(src: str, i: int) -> Tuple[KeyParts, int]:
+    """Parse the first argument of a t() call starting at i."""
+    parts: KeyParts = []
+    while True:
+        while i < len(src) and src[i].isspace():
+            i += 1
+        if i >= len(src):
+            return parts, i
+        operand, i = _read_operand(src, i)
+        parts.extend(operand)
+        while i < len(src) and src[i].isspace():
+            i += 1
+        if i < len(src) and src[i] == '+':
+            i += 1
+            continue
+        return parts, i
+
+def scan_key_usages(content: str) -> List[Tuple[int, KeyParts]]:
+    """Return (line, key parts) for every t() call in some source text."""
+    usages = []
+    line = 1
+    line_offset = 0
+    for match in T_CALL_START.finditer(content):
+        start = match.start()
+        if not is_t_call(content, match):
+            continue
+        parts, _ = parse_key_argument(content, match.end())
+        if not parts:
+            continue
+        line += content.count('\n', line_offset, start)
+        line_offset = start
+        usages.append((line, parts))
+    return usages
+
+def split_ternary(expr: str) -> Optional[Tuple[str, str, str]]:
+    """Split 'cond ? a : b' at its top-level operators, or return None.
+
+    Strings and brackets are skipped, as are '?.' and '??'; a nested ternary in
+    the middle branch is kept whole.
+    """
+    question = None
+    depth = 0
+    i = 0
+    while i < len(expr):
+        char = expr[i]
+        if char in '\'"`':
+            i = _skip_string(expr, i)
+            continue
+        if char in '([{':
+            i = _skip_balanced(expr, i + 1, {'(': ')', '[': ']', '{': '}'}[char])
+            continue
+        if char == '?':
+            if expr.startswith(('?.', '??'), i):
+                i += 2
+                continue
+            if question is None:
+                question = i
+            depth += 1
+        elif char == ':' and question is not None:
+            depth -= 1
+            if depth == 0:
+                return expr[:question].strip(), expr[question + 1:i].strip(), expr[i + 1:].strip()
+        i += 1
+    return None
+
+def _split_params(params: str) -> List[str]:
+    """Split a parameter list on its top-level commas."""
+    parts = []
+    depth = 0
+    current = ''
+    for char in params:
+        if char in '{[<(':
+            depth += 1
+        elif char in '}]>)':
+            depth -= 1
+        if char == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    parts.append(current)
+    return [part.strip() for part in parts if part.strip()]
+
+def _untyped_param_names(params: str) -> List[str]:
+    """Return the names bound by parameters without a type annotation.
+
+    Typed parameters are left to ANNOTATION. Untyped destructuring binds every
+    name inside the pattern.
+    """
+    names = []
+    for param in _split_params(params):
+        param = param.lstrip('.').strip()
+        if param[:1] in '{[':
+            closing = param.rfind('}' if param[0] == '{' else ']')
+            if not param[closing + 1:].lstrip().startswith(':'):
+                names.extend(IDENTIFIER.findall(param[1:closing]))
+            continue
+        match = IDENTIFIER.match(param)
+        if match and not param[match.end():].lstrip().startswith(('?', ':')):
+            names.append(match.group(0))
+    return names
+
+def scan_declarations(content: str) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], Dict[str, str],
+                                             Dict[str, KeyParts]]:
+    """Return (string constants, type annotations, type aliases, key templates) in a file.
+
+    A key template is a name bound once, to a template literal or concatenation
+    such as `shared.${path}`, and nowhere else.
+
+    Declarations are matched by name, not scope. Any binding the scanner cannot
+    classify - an untyped parameter, a for-of variable, a declaration or
+    reassignment with a non-literal value - is recorded as 'unknown', which makes
+    the name unbounded everywhere in the file.
+    """
+    constants: Dict[str, List[str]] = {}
+    annotations: Dict[str, List[str]] = {}
+    aliases: Dict[str, str] = {}
+    templates: Dict[str, KeyParts] = {}
+    unknown: Set[str] = set()
+    for name, definition in TYPE_ALIAS.findall(content):
+        aliases[name] = definition.strip()
+    for name, annotation in ANNOTATION.findall(content):
+        annotations.setdefault(name, []).append(annotation.strip())
+
+    for match in DECLARATION.finditer(content):
+        name, type_annotation, initializer = match.groups()
+        if type_annotation:
+            continue
+        initializer = (initializer or '').strip()
+        if re.fullmatch(STRING_LITERAL, initializer):
+            constants.setdefault(name, []).append(initializer[1:-1])
+            continue
+        parts, end = parse_key_argument(initializer, 0) if initializer[:1] in '`\'"' else ([], 0)
+        if end == len(initializer) and any(isinstance(part, str) for part in parts) and name not in templates:
+            templates[name] = parts
+        else:
+            unknown.add(name)
+    for pattern in DESTRUCTURING.findall(content):
+        unknown.update(IDENTIFIER.findall(pattern))
+    unknown.update(REASSIGNMENT.findall(content))
+    unknown.update(UNTYPED_PARAM.findall(content))
+    for params in ARROW_PARAMS.findall(content) + FUNCTION_PARAMS.findall(content):
+        unknown.update(_untyped_param_names(params))
+
+    # A template only stands for the name when it is the name's sole binding
+    for name in list(templates):
+        if name in unknown or name in constants or name in annotations:
+            del templates[name]
+            unknown.add(name)
+    for name in sorted(unknown):
+        annotations.setdefault(name, []).append('unknown')
+    return constants, annotations, aliases, templates
+
+def _serialise_parts(parts: KeyParts) -> list:
+    return [part if isinstance(part, str) else list(part) for part in parts]
+
+def _deserialise_parts(parts: list) -> KeyParts:
+    return [part if isinstance(part, str) else tuple(part) for part in parts]
+
+def scan_content(content: str) -> dict:
+    """Scan source text for key usages and declarations, in a JSON-serialisable form."""
+    constants, annotations, aliases, templates = scan_declarations(content)
+    return {
+        'usages': [[line, _serialise_parts(parts)] for line, parts in scan_key_usages(content)],
+        'constants': constants,
+        'annotations': annotations,
+        'aliases': aliases,
+        'templates': {name: _serialise_parts(parts) for name, parts in templates.items()},
+    }
+
+def scan_file(file_path: str) -> dict:
+    """Scan a file for key usages and declarations, using the cache when possible."""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    digest = content_digest(raw)
+    cached = load_cached(CACHE_NAMESPACE, digest)
+    if cached is not None:
+        return cached
+
+    scan = scan_content(raw.decode('utf-8'))
+    save_cached(CACHE_NAMESPACE, digest, scan)
+    return scan
+
+class ValueResolver:
+    """Enumerate the finite string values of simple expressions."""
+
+    def __init__(self, aliases: Dict[str, str]):
+        self.aliases = aliases
+
+    def _type_values(self, annotation: str, seen: Set[str]) -> Optional[List[str]]:
+        annotation = annotation.strip()
+        if STRING_UNION.match(annotation):
+            return _literals(annotation)
+        if annotation in self.aliases and annotation not in seen:
+            return self._type_values(self.aliases[annotation], seen | {annotation})
+        return None
+
+    def values(self, expr: str, scan: dict) -> Optional[List[str]]:
+        """Return every string an expression can evaluate to, or None if unbounded."""
+        if re.fullmatch(STRING_LITERAL, expr):
+            return [expr[1:-1]]
+
+        ternary = split_ternary(expr)
+        if ternary:
+            # Both branches must resolve on their own; 'b' + suffix does not
+            _, consequent, alternate = ternary
+            consequent_values = self.values(consequent, scan)
+            alternate_values = self.values(alternate, scan)
+            if consequent_values is None or alternate_values is None:
+                return None
+            return sorted(set(consequent_values) | set(alternate_values))
+
+        if IDENTIFIER_PATH.match(expr):
+            # participant.role / currentParticipant?.role resolve through 'role'
+            name = re.split(r'\??\.', expr)[-1]
+            found: Set[str] = set(scan['constants'].get(name, []))
+            for annotation in scan['annotations'].get(name, []):
+                if re.fullmatch(STRING_LITERAL, annotation):
+                    # Most likely an object literal property, not a type
+                    continue
+                type_values = self._type_values(annotation, set())
+                if type_values is None:
+                    return None
+                found.update(type_values)
+            return sorted(found) or None
+        return None
+
+def expand_patterns(parts: KeyParts, scan: dict, resolver: ValueResolver,
+                    expanding: FrozenSet[str] = frozenset()) -> List[str]:
+    """Expand key parts into key patterns, with WILDCARD for unknown parts.
+
+    Key templates are substituted recursively; a template that refers back to
+    itself becomes a wildcard.
+    """
+    choices: List[List[str]] = []
+    for part in parts:
+        if isinstance(part, str):
+            choices.append([part])
+        elif part[1] in scan['templates'] and part[1] not in expanding:
+            template = _deserialise_parts(scan['templates'][part[1]])
+            choices.append(expand_patterns(template, scan, resolver, expanding | {part[1]}))
+        else:
+            choices.append(resolver.values(part[1], scan) or [WILDCARD])
+
+    combinations = 1
+    for options in choices:
+        combinations *= len(options)
+    if combinations > MAX_EXPANSIONS:
+        choices = [options if len(options) == 1 else [WILDCARD] for options in choices]
+    return [''.join(combination) for combination in itertools.product(*choices)]
+
+class KeyTrie:
+    """The nested catalog viewed as a prefix trie of key segments."""
+
+    def __init__(self, data: dict):
+        self.data = data
+
+    def match(self, pattern: str) -> Set[str]:
+        """Return every leaf key a pattern can refer to.
+
+        The literal segments before the first wildcard are looked up directly;
+        the rest of the pattern is matched against the leaves below them, with a
+        wildcard standing for any text, dots included. A pattern ending at an
+        object covers its subtree.
+        """
+        head, _, _ = pattern.partition(WILDCARD)
+        prefix = head.rpartition('.')[0] if WILDCARD in pattern else pattern
+        node = self.data
+        for segment in prefix.split('.') if prefix else []:
+            if not isinstance(node, dict) or segment not in node:
+                return set()
+            node = node[segment]
+
+        leaves: Set[str] = set()
+        self._collect(node, prefix, leaves)
+        if WILDCARD not in pattern:
+            return leaves
+        regex = re.compile('.*'.join(re.escape(piece) for piece in pattern.split(WILDCARD)) + r'(?:\..*)?',
+                           re.DOTALL)
+        return {key for key in leaves if regex.fullmatch(key)}
+
+    def _collect(self, node, prefix: str, matched: Set[str]):
+        if isinstance(node, dict):
+            for key, child in node.items():
+                self._collect(child, f"{prefix}.{key}" if prefix else key, matched)
+        else:
+            matched.add(prefix)
+
+def find_source_files(directory: str) -> List[str]:
+    """Find all TypeScript/TSX source files, skipping tests."""
+    ts_files = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in ['node_modules', 'dist', 'build', '.git', '__tests__']]
+        for file in files:
+            if file.endswith(('.ts', '.tsx')):
+                ts_files.append(os.path.join(root, file))
+    return sorted(ts_files)
+
+def iter_resolved_usages(scans: Dict[str, dict]) -> Iterator[Tuple[str, int, KeyParts, List[str]]]:
+    """Yield (file, line, parts, patterns) for every t() call across scanned files."""
+    aliases: Dict[str, str] = {}
+    for scan in scans.values():
+        aliases.update(scan['aliases'])
+    resolver = ValueResolver(aliases)
+
+    for file_path, scan in scans.items():
+        for line, parts in scan['usages']:
+            parts = _deserialise_parts(parts)
+            yield file_path, line, parts, expand_patterns(parts, scan, resolver)
+
+def shared_references(flattened: Dict[str, str]) -> Set[str]:
+    """Return the keys referenced from values through {{shared.*}}."""
+    return {ref for value in flattened.values() for ref in SHARED_REFERENCE_PATTERN.findall(value)}
+
+def is_unbounded(pattern: str) -> bool:
+    """Return True for patterns with no literal key segment at all."""
+    return pattern.strip(WILDCARD + '.') == ''
+
+def format_pattern(pattern: str) -> str:
+    return pattern.replace(WILDCARD, '*')
+
+def main():
+    """Main function to report key usage, unknown keys and pruning candidates."""
+    parser = argparse.ArgumentParser(description="Resolve static and dynamic translation keys used in src.")
+    parser.add_argument('directory', nargs='?', default='src')
+    parser.add_argument('--catalog', default='src/i18n/locales/en.json')
+    parser.add_argument('--prune-candidates', action='store_true', help="List keys no code can reach")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    reporter = open_reporter(args.format, args.output)
+    log = print if reporter is None else (lambda *_: None)
+
+    data = load_json_file(args.catalog)
+    flattened = flatten_dict(data)
+    trie = KeyTrie(data)
+    scans = {file_path: scan_file(file_path) for file_path in find_source_files(args.directory)}
+
+    used: Set[str] = set(shared_references(flattened))
+    static_calls = 0
+    dynamic_calls = 0
+    unbounded = []
+    unknown = []
+
+    for file_path, line, parts, patterns in iter_resolved_usages(scans):
+        if all(isinstance(part, str) for part in parts):
+            static_calls += 1
+        else:
+            dynamic_calls += 1
+            if all(is_unbounded(pattern) for pattern in patterns):
+                # e.g. t(fullPath) - it could be any key, so it cannot guide pruning
+                unbounded.append((file_path, line, parts))
+                continue
+
+        matched: Set[str] = set()
+        for pattern in patterns:
+            matched |= trie.match(pattern)
+        used |= matched
+        if not matched:
+            unknown.append((file_path, line, patterns))
+
+    log(f"📁 Scanned {len(scans)} files: {static_calls} static and {dynamic_calls} dynamic t() calls")
+    log(f"🔑 Catalog keys reachable from code: {len(used & set(flattened))}/{len(flattened)}")
+
+    if unknown:
+        log("\n" + "=" * 60)
+        log("❌ KEYS NOT IN CATALOG")
+        log("=" * 60)
+        for file_path, line, patterns in unknown:
+            shown = ', '.join(format_pattern(pattern) for pattern in patterns)
+            log(f"   {file_path}:{line}: {shown}")
+            if reporter:
+                reporter.report('unknown-key', f"No catalog key matches {shown}", file=file_path,
+                                line=line, level='error', patterns=[format_pattern(p) for p in patterns])
+
+    if unbounded:
+        log("\n" + "=" * 60)
+        log("⚠️  UNBOUNDED KEY EXPRESSIONS (not used for pruning)")
+        log("=" * 60)
+        for file_path, line, parts in unbounded:
+            expression = ' + '.join(part if isinstance(part, str) else part[1] for part in parts)
+            log(f"   {file_path}:{line}: t({expression})")
+            if reporter:
+                reporter.report('unbounded-key', f"Key expression cannot be resolved: {expression}",
+                                file=file_path, line=line, level='note', expression=expression)
+
+    if args.prune_candidates and unbounded:
+        # Any of the unreached keys could be requested by an unbounded call
+        message = (f"{len(unbounded)} unbounded key expression(s) could request any key, "
+                   f"so no key is safe to prune")
+        log("\n" + "=" * 60)
+        log("🧹 PRUNING CANDIDATES WITHHELD")
+        log("=" * 60)
+        log(f"❌ {message}; resolve or remove the calls listed above")
+        if reporter:
+            reporter.report('prune-unsafe', message, file=args.catalog, level='error', unbounded=len(unbounded))
+    elif args.prune_candidates:
+        candidates = sorted(key for key in flattened if key not in used)
+        log("\n" + "=" * 60)
+        log(f"🧹 PRUNING CANDIDATES ({len(candidates)})")
+        log("=" * 60)
+        for key in candidates:
+            log(f"   {key}")
+            if reporter:
+                reporter.report('unused-key', f"{key} is not reachable from code",
+                                file=args.catalog, level='note', key=key)
+
+    if reporter:
+        reporter.close()
+    if args.prune_candidates and unbounded:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Script to resolve {{shared.*}} references in a translation catalog.
+
+Values such as "{{shared.roles.speaker}} notes" are expanded with the same
+pattern useTranslation.ts uses at runtime. The runtime expands one level only;
+references nested inside shared values are expanded here as well, as a deliberate
+superset, so the resolved view never hides a shared value behind a placeholder.
+Each referenced key is expanded once and memoized, and reference cycles are
+reported instead of recursing forever. The resolved view is cached on disk
+keyed by the catalog's content hash.
+"""
+
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from analyze_redundancies import load_json_file, flatten_dict
+from i18n_cache import file_digest, load_cached, save_cached
+
+# Same pattern as resolveSharedComponents() in src/hooks/useTranslation.ts
+SHARED_REFERENCE_PATTERN = re.compile(r'\{\{(shared\.[^}]+)\}\}')
+
+CACHE_NAMESPACE = 'resolved'
+
+class CircularReferenceError(ValueError):
+    """Raised when shared references form a cycle."""
+
+    def __init__(self, chain: List[str], file_path: Optional[str] = None):
+        self.chain = chain
+        self.file_path = file_path
+        super().__init__("Circular shared reference: " + " → ".join(chain))
+
+class SharedReferenceResolver:
+    """Expand {{shared.*}} references in a flattened catalog with memoization."""
+
+    def __init__(self, flattened: Dict[str, str]):
+        self.flattened = flattened
+        self.unresolved: Dict[str, List[str]] = {}
+        self._memo: Dict[str, str] = {}
+        self._stack: List[str] = []
+        self._on_stack = set()
+
+    def resolve_key(self, key: str) -> str:
+        """Return the fully expanded value of a key."""
+        if key in self._memo:
+            return self._memo[key]
+        if key in self._on_stack:
+            start = self._stack.index(key)
+            raise CircularReferenceError(self._stack[start:] + [key])
+
+        self._stack.append(key)
+        self._on_stack.add(key)
+        try:
+            resolved = self._expand(key, self.flattened[key])
+        finally:
+            self._stack.pop()
+            self._on_stack.discard(key)
+
+        self._memo[key] = resolved
+        return resolved
+
+    def resolve_value(self, value: str) -> str:
+        """Expand the references in a value that is not itself a catalog key."""
+        return self._expand(None, value)
+
+    def resolve_all(self) -> Dict[str, str]:
+        """Return a flattened view with every reference expanded."""
+        return {key: self.resolve_key(key) for key in self.flattened}
+
+    def _expand(self, owner: Optional[str], value: str) -> str:
+        if '{{shared.' not in value:
+            return value
+
+        def replace(match):
+            ref = match.group(1)
+            if ref not in self.flattened:
+                # Leave the placeholder untouched, as the runtime does
+                self.unresolved.setdefault(ref, []).append(owner or '<value>')
+                return match.group(0)
+            return self.resolve_key(ref)
+
+        return SHARED_REFERENCE_PATTERN.sub(replace, value)
+
+def resolve_flattened(flattened: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """Resolve a flattened catalog. Returns (resolved view, unresolved references)."""
+    resolver = SharedReferenceResolver(flattened)
+    return resolver.resolve_all(), resolver.unresolved
+
+def load_resolved_catalog(file_path: str, use_cache: bool = True) -> Dict[str, str]:
+    """Load a catalog file and return its flattened, fully resolved view.
+
+    Raises CircularReferenceError, with file_path set, when the catalog's shared
+    references form a cycle.
+    """
+    digest = file_digest(file_path) if use_cache else None
+    if digest:
+        cached = load_cached(CACHE_NAMESPACE, digest)
+        if cached is not None:
+            return cached
+
+    try:
+        resolved, _ = resolve_flattened(flatten_dict(load_json_file(file_path)))
+    except CircularReferenceError as e:
+        e.file_path = file_path
+        raise
+
+    if digest:
+        save_cached(CACHE_NAMESPACE, digest, resolved)
+    return resolved
+
+def report_circular_reference(error: CircularReferenceError, reporter=None):
+    """Report a reference cycle as an error result, or on stderr in text mode."""
+    if reporter:
+        reporter.report('circular-reference', str(error), file=error.file_path, level='error', chain=error.chain)
+    else:
+        print(f"❌ {error.file_path}: {error}", file=sys.stderr)
+
+def main():
+    """Main function to report on shared reference resolution."""
+    file_path = sys.argv[1] if len(sys.argv) > 1 else "src/i18n/locales/en.json"
+    print(f"🔍 Resolving shared references in {file_path}...")
+
+    flattened = flatten_dict(load_json_file(file_path))
+    references = sum(1 for value in flattened.values() if '{{shared.' in value)
+
+    try:
+        resolved, unresolved = resolve_flattened(flattened)
+    except CircularReferenceError as e:
+        e.file_path = file_path
+        report_circular_reference(e)
+        sys.exit(1)
+
+    expanded = sum(1 for key in flattened if flattened[key] != resolved[key])
+
+    print(f"📊 Total entries: {len(flattened)}")
+    print(f"🔄 Values containing shared references: {references}")
+    print(f"✅ Values expanded: {expanded}")
+
+    if unresolved:
+        print(f"\n⚠️  Unresolved references: {len(unresolved)}")
+        for ref, keys in sorted(unresolved.items()):
+            print(f"   {{{{{ref}}}}} used by: {', '.join(keys)}")
+        sys.exit(1)
+
+    save_cached(CACHE_NAMESPACE, file_digest(file_path), resolved)
+
+if __name__ == "__main__":
+    main()